@@ -49,6 +49,8 @@ class GoogleBooksEnricher(Enricher):
     MAX_RESULTS = 3  # Maximum number of results to consider per book search
     DELAY = 1.0  # Delay between requests to avoid API rate limiting
     CACHE_EXPIRY = 86400  # Cache expiry in seconds (24 hours)
+    ISBN_KEYS = {'ISBN_10': 'isbn_10', 'ISBN_13': 'isbn_13'}  # Identifier type -> BookMetadata field
+    IMAGE_KEYS = ('large', 'medium', 'thumbnail', 'smallThumbnail')  # Cover sizes, largest first
     
     def __init__(self, api_key: Optional[str] = None):
         """
@@ -93,8 +95,8 @@ class GoogleBooksEnricher(Enricher):
             # Read the CSV file
             try:
                 df = pd.read_csv(csv_path)
-                self.logger.debug(f"Successfully loaded CSV with {len(df)} rows and {len(df.columns)} columns")
-                self.logger.debug(f"CSV columns: {list(df.columns)}")
+                self.logger.debug("Successfully loaded CSV with %s rows and %s columns", len(df), len(df.columns))
+                self.logger.debug("CSV columns: %s", list(df.columns))
             except Exception as csv_error:
                 self.logger.error(f"Failed to read CSV file: {str(csv_error)}")
                 return None
@@ -129,7 +131,7 @@ class GoogleBooksEnricher(Enricher):
                 for col in metadata_columns:
                     df_enriched[col] = None
                     
-                self.logger.debug(f"Created enriched DataFrame with columns: {list(df_enriched.columns)}")
+                self.logger.debug("Created enriched DataFrame with columns: %s", list(df_enriched.columns))
             except Exception as df_error:
                 self.logger.error(f"Failed to create enriched dataframe: {str(df_error)}")
                 return None
@@ -197,7 +199,7 @@ class GoogleBooksEnricher(Enricher):
             # Save the enriched CSV
             try:
                 df_enriched.to_csv(output_path, index=False, encoding='utf-8')
-                self.logger.debug(f"Successfully saved enriched CSV to {output_path}")
+                self.logger.debug("Successfully saved enriched CSV to %s", output_path)
             except Exception as save_error:
                 self.logger.error(f"Failed to save enriched CSV: {str(save_error)}")
                 return None
@@ -214,7 +216,7 @@ class GoogleBooksEnricher(Enricher):
             try:
                 self._generate_summary(df_enriched, matches_found, total_rows)
             except Exception as summary_error:
-                self.logger.warning(f"Failed to generate summary: {str(summary_error)}")
+                self.logger.warning("Failed to generate summary: %s", summary_error)
             
             return output_path
             
@@ -270,7 +272,7 @@ class GoogleBooksEnricher(Enricher):
                 if time.time() - cached_data.get('timestamp', 0) < self.CACHE_EXPIRY:
                     return cached_data.get('data')
             except Exception as e:
-                self.logger.warning(f"Error reading cache: {str(e)}")
+                self.logger.warning("Error reading cache: %s", e)
         
         return None
     
@@ -291,7 +293,7 @@ class GoogleBooksEnricher(Enricher):
             with open(cache_file, 'w', encoding='utf-8') as f:
                 json.dump(cached_data, f, ensure_ascii=False, indent=2)
         except Exception as e:
-            self.logger.warning(f"Error writing to cache: {str(e)}")
+            self.logger.warning("Error writing to cache: %s", e)
     
     def _try_search(self, query: str, lang_restrict: Optional[str] = None) -> Optional[BookMetadata]:
         """
@@ -306,7 +308,7 @@ class GoogleBooksEnricher(Enricher):
         """
         try:
             # Enhanced logging
-            self.logger.debug(f"Starting search with query: '{query}', language: {lang_restrict or 'all'}")
+            self.logger.debug("Starting search with query: '%s', language: %s", query, lang_restrict or 'all')
             
             # Check cache first
             cache_key = self._cache_key(query, lang_restrict)
@@ -314,9 +316,9 @@ class GoogleBooksEnricher(Enricher):
             
             if cached_result:
                 # Enhanced logging
-                self.logger.debug(f"Cache hit for query: '{query}'")
-                self.logger.debug(f"Cache structure: keys={list(cached_result.keys() if cached_result else {})}")
-                self.logger.debug(f"Found {len(cached_result.get('items', []))} items in cache")
+                self.logger.debug("Cache hit for query: '%s'", query)
+                self.logger.debug("Cache structure: keys=%s", list(cached_result.keys() if cached_result else {}))
+                self.logger.debug("Found %s items in cache", len(cached_result.get('items', [])))
                 
                 # If cached result indicates no matches, return None
                 if not cached_result.get('items'):
@@ -346,13 +348,13 @@ class GoogleBooksEnricher(Enricher):
                     metadata = self._parse_volume_info(best_match, highest_confidence, best_confidence_factors)
                     if best_item:  # Safety check
                         metadata.volume_id = best_item.get('id')
-                        self.logger.debug(f"Found match in cache: '{metadata.title}' (confidence: {highest_confidence:.2f})")
+                        self.logger.debug("Found match in cache: '%s' (confidence: %.2f)", metadata.title, highest_confidence)
                     return metadata
                 
                 return None
             
             # Perform the search if not in cache
-            self.logger.debug(f"No cache hit, performing API request for: '{query}'")
+            self.logger.debug("No cache hit, performing API request for: '%s'", query)
             
             params = {
                 'q': query,
@@ -375,13 +377,13 @@ class GoogleBooksEnricher(Enricher):
             data = response.json()
             
             # Enhanced logging
-            self.logger.debug(f"API response received: status={response.status_code}, content_length={len(response.content)}")
+            self.logger.debug("API response received: status=%s, content_length=%s", response.status_code, len(response.content))
             
             # Cache results
             self._save_to_cache(cache_key, data)
             
             total_items = data.get('totalItems', 0)
-            self.logger.debug(f"Found {total_items} results")
+            self.logger.debug("Found %s results", total_items)
             
             if total_items == 0:
                 return None
@@ -400,7 +402,7 @@ class GoogleBooksEnricher(Enricher):
                 )
                 
                 title = volume_info.get('title', 'Unknown')
-                self.logger.debug(f"Analyzing result: '{title}' (Confidence: {confidence:.2f})")
+                self.logger.debug("Analyzing result: '%s' (Confidence: %.2f)", title, confidence)
                 
                 if confidence > highest_confidence:
                     highest_confidence = confidence
@@ -412,18 +414,19 @@ class GoogleBooksEnricher(Enricher):
                 metadata = self._parse_volume_info(best_match, highest_confidence, best_confidence_factors)
                 if best_item:  # Safety check
                     metadata.volume_id = best_item.get('id')
-                    self.logger.debug(f"Best match found: '{metadata.title}' (confidence: {highest_confidence:.2f})")
+                    self.logger.debug("Best match found: '%s' (confidence: %.2f)", metadata.title, highest_confidence)
                 return metadata
             
-            self.logger.debug(f"No suitable match found for query: '{query}'")
+            self.logger.debug("No suitable match found for query: '%s'", query)
             return None
                 
         except Exception as e:
             # Enhanced error handling
             self.logger.warning(
-                f"Error in search '{query}': {str(e)}\n"
-                f"Exception type: {type(e).__name__}\n"
-                f"Query details: Language={lang_restrict}, Cache_key={cache_key}"
+                "Error in search '%s': %s\n"
+                "Exception type: %s\n"
+                "Query details: Language=%s, Cache_key=%s",
+                query, e, type(e).__name__, lang_restrict, cache_key
             )
             return None
     
@@ -478,7 +481,7 @@ class GoogleBooksEnricher(Enricher):
         ]
         
         for i, strategy in enumerate(search_strategies):
-            self.logger.debug(f"Trying search strategy {i+1}")
+            self.logger.debug("Trying search strategy %s", i+1)
             result = strategy()
             if result:
                 self.logger.info(f"Found match using strategy {i+1}")
@@ -509,7 +512,7 @@ class GoogleBooksEnricher(Enricher):
             author = author.strip() if author and author.strip().lower() != "desconhecido" else None
 
             # Enhanced logging
-            self.logger.debug(f"Multiple results search for title='{title}', author='{author}', max_results={max_results}")
+            self.logger.debug("Multiple results search for title='%s', author='%s', max_results=%s", title, author, max_results)
 
             if not title:
                 self.logger.warning("Empty title provided, skipping search")
@@ -526,9 +529,9 @@ class GoogleBooksEnricher(Enricher):
 
             data = None
             if cached_result:
-                self.logger.debug(f"Using cached results for: {query}")
+                self.logger.debug("Using cached results for: %s", query)
                 data = cached_result
-                self.logger.debug(f"Cache structure: keys={list(data.keys() if data else {})}")
+                self.logger.debug("Cache structure: keys=%s", list(data.keys() if data else {}))
             else:
                 # Realizar a busca se não estiver em cache
                 params = {
@@ -542,7 +545,7 @@ class GoogleBooksEnricher(Enricher):
 
                 self._throttle_request()
 
-                self.logger.debug(f"Performing API request with query: {query}")
+                self.logger.debug("Performing API request with query: %s", query)
                 response = self.session.get(self.BASE_URL, params=params)
                 response.raise_for_status()
                 data = response.json()
@@ -554,7 +557,7 @@ class GoogleBooksEnricher(Enricher):
             ranked_results = []
             items = data.get('items', [])
 
-            self.logger.debug(f"Found {len(items)} items in response")
+            self.logger.debug("Found %s items in response", len(items))
 
             if not items:
                 # Se não houver resultados, tentar uma busca mais genérica
@@ -573,14 +576,14 @@ class GoogleBooksEnricher(Enricher):
                     params['q'] = query_simple
                     self._throttle_request()
 
-                    self.logger.debug(f"Performing API request with generic query: {query_simple}")
+                    self.logger.debug("Performing API request with generic query: %s", query_simple)
                     response = self.session.get(self.BASE_URL, params=params)
                     response.raise_for_status()
                     data_simple = response.json()
                     self._save_to_cache(cache_key_simple, data_simple)
 
                 items = data_simple.get('items', [])
-                self.logger.debug(f"Found {len(items)} items with generic query")
+                self.logger.debug("Found %s items with generic query", len(items))
 
             # Processar itens
             for item in items:
@@ -598,21 +601,22 @@ class GoogleBooksEnricher(Enricher):
                     if volume_id:  # Safety check
                         metadata.volume_id = volume_id
                     ranked_results.append((confidence, metadata))
-                    self.logger.debug(f"Added result: '{metadata.title}' (confidence: {confidence:.2f})")
+                    self.logger.debug("Added result: '%s' (confidence: %.2f)", metadata.title, confidence)
 
             # Ordenar por confiança e pegar os melhores
             ranked_results.sort(key=lambda x: x[0], reverse=True)
             results = [metadata for _, metadata in ranked_results[:max_results]]
 
-            self.logger.debug(f"Returning {len(results)} results")
+            self.logger.debug("Returning %s results", len(results))
             return results
 
         except Exception as e:
             # Enhanced error handling
             self.logger.warning(
-                f"Error in multiple results search: {str(e)}\n"
-                f"Exception type: {type(e).__name__}\n"
-                f"Search details: title='{title}', author='{author}', max_results={max_results}"
+                "Error in multiple results search: %s\n"
+                "Exception type: %s\n"
+                "Search details: title='%s', author='%s', max_results=%s",
+                e, type(e).__name__, title, author, max_results
             )
             return results
 
@@ -633,17 +637,17 @@ class GoogleBooksEnricher(Enricher):
                 return None
 
             # Enhanced logging
-            self.logger.debug(f"Fetching book by ID: {volume_id}")
+            self.logger.debug("Fetching book by ID: %s", volume_id)
 
             # Verificar o cache primeiro
             cache_key = f"volume_{volume_id}"
             cached_result = self._get_from_cache(cache_key)
 
             if cached_result:
-                self.logger.debug(f"Using cached volume: {volume_id}")
+                self.logger.debug("Using cached volume: %s", volume_id)
                 volume_info = cached_result.get('volumeInfo', {})
                 if not volume_info:  # Safety check
-                    self.logger.warning(f"Cached data for volume {volume_id} has no volumeInfo")
+                    self.logger.warning("Cached data for volume %s has no volumeInfo", volume_id)
                     return None
 
                 metadata = self._parse_volume_info(volume_info, 1.0, {})
@@ -658,7 +662,7 @@ class GoogleBooksEnricher(Enricher):
 
             self._throttle_request()
         
-            self.logger.debug(f"Performing API request for volume: {volume_id}")
+            self.logger.debug("Performing API request for volume: %s", volume_id)
             response = self.session.get(url, params=params)
             response.raise_for_status()
             data = response.json()
@@ -668,20 +672,21 @@ class GoogleBooksEnricher(Enricher):
 
             volume_info = data.get('volumeInfo', {})
             if not volume_info:  # Safety check
-                self.logger.warning(f"API response for volume {volume_id} has no volumeInfo")
+                self.logger.warning("API response for volume %s has no volumeInfo", volume_id)
                 return None
 
             metadata = self._parse_volume_info(volume_info, 1.0, {})
             metadata.volume_id = volume_id
 
-            self.logger.debug(f"Successfully retrieved book: '{metadata.title}'")
+            self.logger.debug("Successfully retrieved book: '%s'", metadata.title)
             return metadata
 
         except Exception as e:
             # Enhanced error handling
             self.logger.warning(
-                f"Error fetching volume {volume_id}: {str(e)}\n"
-                f"Exception type: {type(e).__name__}"
+                "Error fetching volume %s: %s\n"
+                "Exception type: %s",
+                volume_id, e, type(e).__name__
             )
             return None
 
@@ -707,7 +712,7 @@ class GoogleBooksEnricher(Enricher):
         
         try:
             # Enhanced logging
-            self.logger.debug(f"Calculating match confidence for book: '{volume_info.get('title', 'Unknown')}'")
+            self.logger.debug("Calculating match confidence for book: '%s'", volume_info.get('title', 'Unknown'))
             
             # Safety checks for null values
             if not volume_info:
@@ -786,9 +791,11 @@ class GoogleBooksEnricher(Enricher):
             # Calculate author match if provided
             if search_author and book_authors:
                 best_author_match = 0
+                # The search author is the same for every candidate: clean and measure it once
+                clean_search_author = re.sub(r'[^\w\s]', ' ', search_author)
+                search_author_len = len(clean_search_author)
                 for book_author in book_authors:
                     clean_book_author = re.sub(r'[^\w\s]', ' ', book_author) if book_author else ''
-                    clean_search_author = re.sub(r'[^\w\s]', ' ', search_author) if search_author else ''
                     
                     if clean_book_author and clean_search_author:  # Safety check
                         # Check for exact match or substring match
@@ -796,24 +803,31 @@ class GoogleBooksEnricher(Enricher):
                             best_author_match = 1.0
                             break
                         elif clean_search_author in clean_book_author or clean_book_author in clean_search_author:
-                            author_ratio = min(len(clean_search_author), len(clean_book_author)) / max(len(clean_search_author), len(clean_book_author))
-                            best_author_match = max(best_author_match, author_ratio)
+                            # Substring match: the shorter name is always contained in the longer one
+                            book_author_len = len(clean_book_author)
+                            if search_author_len < book_author_len:
+                                author_ratio = search_author_len / book_author_len
+                            else:
+                                author_ratio = book_author_len / search_author_len
+                            if author_ratio > best_author_match:
+                                best_author_match = author_ratio
                 
                 confidence_factors['author_match'] = 0.3 * best_author_match
             
             # Calculate total confidence
             total_confidence = sum(confidence_factors.values())
             
-            self.logger.debug(f"Confidence calculation: {confidence_factors} = {total_confidence}")
+            self.logger.debug("Confidence calculation: %s = %s", confidence_factors, total_confidence)
             
             return min(total_confidence, 1.0), confidence_factors
             
         except Exception as e:
             # Enhanced error handling
             self.logger.warning(
-                f"Error calculating match confidence: {str(e)}\n"
-                f"Exception type: {type(e).__name__}\n"
-                f"Book title: '{volume_info.get('title', 'Unknown')}'"
+                "Error calculating match confidence: %s\n"
+                "Exception type: %s\n"
+                "Book title: '%s'",
+                e, type(e).__name__, volume_info.get('title', 'Unknown')
             )
             return 0.0, {}
     
@@ -837,28 +851,25 @@ class GoogleBooksEnricher(Enricher):
                 return BookMetadata(title="Unknown")
                 
             # Enhanced logging
-            self.logger.debug(f"Parsing volume info for: '{volume_info.get('title', 'Unknown')}'")
+            self.logger.debug("Parsing volume info for: '%s'", volume_info.get('title', 'Unknown'))
                 
             # Extract ISBNs
-            isbn_10 = None
-            isbn_13 = None
+            isbns = {}
             industry_identifiers = volume_info.get('industryIdentifiers', [])
             if industry_identifiers:
+                isbn_keys = self.ISBN_KEYS
                 for identifier in industry_identifiers:
-                    if identifier.get('type') == 'ISBN_10':
-                        isbn_10 = identifier.get('identifier')
-                    elif identifier.get('type') == 'ISBN_13':
-                        isbn_13 = identifier.get('identifier')
+                    key = isbn_keys.get(identifier.get('type'))
+                    if key:
+                        isbns[key] = identifier.get('identifier')
             
             # Extract cover link (prefer larger version if available)
             cover_link = None
             image_links = volume_info.get('imageLinks', {})
             if image_links:
-                cover_link = (
-                    image_links.get('large') or 
-                    image_links.get('medium') or 
-                    image_links.get('thumbnail') or 
-                    image_links.get('smallThumbnail')
+                cover_link = next(
+                    (image_links[key] for key in self.IMAGE_KEYS if image_links.get(key)),
+                    None
                 )
             
             # Create the BookMetadata object with safe defaults
@@ -868,8 +879,8 @@ class GoogleBooksEnricher(Enricher):
                 authors=volume_info.get('authors', []),
                 publisher=volume_info.get('publisher'),
                 published_date=volume_info.get('publishedDate'),
-                isbn_10=isbn_10,
-                isbn_13=isbn_13,
+                isbn_10=isbns.get('isbn_10'),
+                isbn_13=isbns.get('isbn_13'),
                 page_count=volume_info.get('pageCount'),
                 categories=volume_info.get('categories', []),
                 language=volume_info.get('language'),
@@ -888,9 +899,10 @@ class GoogleBooksEnricher(Enricher):
         except Exception as e:
             # Enhanced error handling
             self.logger.warning(
-                f"Error parsing volume info: {str(e)}\n"
-                f"Exception type: {type(e).__name__}\n"
-                f"Book title: '{volume_info.get('title', 'Unknown')}'"
+                "Error parsing volume info: %s\n"
+                "Exception type: %s\n"
+                "Book title: '%s'",
+                e, type(e).__name__, volume_info.get('title', 'Unknown')
             )
             # Return a minimal valid object
             return BookMetadata(title=volume_info.get('title', 'Unknown'))
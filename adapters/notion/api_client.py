@@ -4,6 +4,12 @@ import requests
 import json
 import time
 from typing import Dict, Any, List, Optional
+from requests.adapters import HTTPAdapter
+
+try:
+    import orjson  # Optional: faster payload serialization
+except ImportError:
+    orjson = None
 
 from core.domain.notion_export_config import NotionExportConfig
 from core.interfaces.notion_api_client import NotionApiClient
@@ -32,6 +38,9 @@ class HttpNotionApiClient(NotionApiClient):
             "Content-Type": "application/json",
             "Notion-Version": config.api_version
         }
+        # Keep-alive connection pool shared by all requests (and export threads)
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(pool_maxsize=max(10, config.concurrency)))
         self.logger = logging.getLogger(__name__)
     
     def get_database(self, database_id: str) -> Dict[str, Any]:
@@ -196,12 +205,18 @@ class HttpNotionApiClient(NotionApiClient):
         try:
             self.logger.debug(f"Making {method} request to {url}")
             
-            response = requests.request(
+            if orjson is not None and json_data is not None:
+                # Content-Type is already application/json in self.headers
+                body = {"data": orjson.dumps(json_data)}
+            else:
+                body = {"json": json_data}
+            
+            response = self.session.request(
                 method=method,
                 url=url,
                 headers=self.headers,
-                json=json_data,
-                timeout=self.config.timeout
+                timeout=self.config.timeout,
+                **body
             )
             
             # Handle rate limiting
@@ -9,6 +9,29 @@ from core.interfaces.notion_database_verifier import NotionDatabaseVerifier
 class DefaultNotionDatabaseCreator(NotionDatabaseCreator):
     """Implementation of NotionDatabaseCreator."""
     
+    # Options for select properties, keyed by property name
+    SELECT_OPTIONS = {
+        "Reading Status": [
+            {"name": "Unread", "color": "gray"},
+            {"name": "Reading", "color": "blue"},
+            {"name": "Read", "color": "green"},
+            {"name": "To Read", "color": "yellow"},
+            {"name": "Reference", "color": "purple"}
+        ],
+        "Format": [
+            {"name": "EPUB", "color": "blue"},
+            {"name": "PDF", "color": "red"},
+            {"name": "MOBI", "color": "green"},
+            {"name": "AZW3", "color": "orange"},
+            {"name": "TXT", "color": "gray"},
+            {"name": "Unknown", "color": "default"}
+        ]
+    }
+    
+    # Properties payload per verifier class, built once per process: the schema is
+    # static, and the factory creates a new creator for every exporter
+    _properties_cache: Dict[type, Dict[str, Any]] = {}
+    
     def __init__(self, api_client: NotionApiClient, db_verifier: NotionDatabaseVerifier):
         """
         Initializes the creator.
@@ -33,34 +56,11 @@ class DefaultNotionDatabaseCreator(NotionDatabaseCreator):
             Database ID if created successfully, None otherwise
         """
         try:
-            # Define properties using the expected structure from the verifier
-            properties = {}
-            expected_properties = self.db_verifier.get_expected_properties()
-            
-            # Convert to the API format
-            for prop_name, prop_details in expected_properties.items():
-                prop_type = prop_details.get("type")
-                properties[prop_name] = {prop_type: {}}
-                
-                # Add options for select and multi_select properties
-                if prop_type == "select":
-                    if prop_name == "Reading Status":
-                        properties[prop_name][prop_type]["options"] = [
-                            {"name": "Unread", "color": "gray"},
-                            {"name": "Reading", "color": "blue"},
-                            {"name": "Read", "color": "green"},
-                            {"name": "To Read", "color": "yellow"},
-                            {"name": "Reference", "color": "purple"}
-                        ]
-                    elif prop_name == "Format":
-                        properties[prop_name][prop_type]["options"] = [
-                            {"name": "EPUB", "color": "blue"},
-                            {"name": "PDF", "color": "red"},
-                            {"name": "MOBI", "color": "green"},
-                            {"name": "AZW3", "color": "orange"},
-                            {"name": "TXT", "color": "gray"},
-                            {"name": "Unknown", "color": "default"}
-                        ]
+            # The payload only depends on the verifier's static schema, so build it once
+            verifier_type = type(self.db_verifier)
+            properties = self._properties_cache.get(verifier_type)
+            if properties is None:
+                properties = self._properties_cache[verifier_type] = self._build_properties()
             
             # Create the database
             database = self.api_client.create_database(page_id, title, properties)
@@ -76,3 +76,24 @@ class DefaultNotionDatabaseCreator(NotionDatabaseCreator):
         except Exception as e:
             self.logger.error(f"Error creating database: {str(e)}")
             return None
+    
+    def _build_properties(self) -> Dict[str, Any]:
+        """
+        Builds the database properties payload from the expected structure.
+        
+        Returns:
+            Dictionary of property definitions in API format
+        """
+        properties = {}
+        expected_properties = self.db_verifier.get_expected_properties()
+        
+        # Convert to the API format
+        for prop_name, prop_details in expected_properties.items():
+            prop_type = prop_details.get("type")
+            properties[prop_name] = {prop_type: {}}
+            
+            # Add options for select properties
+            if prop_type == "select" and prop_name in self.SELECT_OPTIONS:
+                properties[prop_name][prop_type]["options"] = self.SELECT_OPTIONS[prop_name]
+        
+        return properties
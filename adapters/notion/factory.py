@@ -19,6 +19,9 @@ from adapters.notion.exporter import NotionExporter
 class NotionExporterFactory:
     """Factory for creating NotionExporter instances with all dependencies."""
     
+    # The record mapper holds no per-export state, so every exporter shares one
+    _record_mapper: Optional[NotionRecordMapper] = None
+    
     @staticmethod
     def create_exporter(config_dict: Dict[str, Any]) -> Exporter:
         """
@@ -42,8 +45,8 @@ class NotionExporterFactory:
         # Create database creator
         db_creator = DefaultNotionDatabaseCreator(api_client, db_verifier)
         
-        # Create record mapper
-        record_mapper = GoogleBooksNotionRecordMapper()
+        # Reuse the shared record mapper
+        record_mapper = NotionExporterFactory._get_record_mapper()
         
         # Create export service
         export_service = NotionExportService(
@@ -57,6 +60,18 @@ class NotionExporterFactory:
         # Create exporter
         return NotionExporter(export_service)
     
+    @staticmethod
+    def _get_record_mapper() -> NotionRecordMapper:
+        """
+        Gets the shared record mapper, creating it on first use.
+        
+        Returns:
+            GoogleBooksNotionRecordMapper instance
+        """
+        if NotionExporterFactory._record_mapper is None:
+            NotionExporterFactory._record_mapper = GoogleBooksNotionRecordMapper()
+        return NotionExporterFactory._record_mapper
+    
     @staticmethod
     def _create_config(config_dict: Dict[str, Any]) -> NotionExportConfig:
         """
@@ -73,5 +88,7 @@ class NotionExporterFactory:
             database_id=config_dict.get("database_id"),
             page_id=config_dict.get("page_id"),
             database_name=config_dict.get("database_name", "Biblioteca de Ebooks"),
-            create_database_if_not_exists=config_dict.get("create_database_if_not_exists", False)
+            create_database_if_not_exists=config_dict.get("create_database_if_not_exists", False),
+            batch_size=config_dict.get("batch_size", 10),
+            concurrency=config_dict.get("concurrency", 3)
         )
\ No newline at end of file
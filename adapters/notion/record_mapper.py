@@ -9,11 +9,56 @@ from core.interfaces.notion_record_mapper import NotionRecordMapper
 class GoogleBooksNotionRecordMapper(NotionRecordMapper):
     """
     Implementation of NotionRecordMapper that prioritizes Google Books data.
+    
+    Holds no per-record or per-export state (only value caches), so a single
+    instance can be shared by several exporters.
     """
     
+    TOPIC_SEPARATORS = str.maketrans(";", ",")  # Topics may be separated by ',' or ';'
+    # Accepted date formats: %Y-%m-%d [%H:%M[:%S]], %Y/%m/%d, %d/%m/%Y and %d-%m-%Y
+    DATE_PATTERN = re.compile(
+        r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})'
+        r'(?:\s+(?P<hour>\d{1,2}):(?P<minute>\d{1,2})(?::(?P<second>\d{1,2}))?)?'
+        r'|(?P<year_slash>\d{4})/(?P<month_slash>\d{1,2})/(?P<day_slash>\d{1,2})'
+        r'|(?P<day_first>\d{1,2})(?P<sep>[-/])(?P<month_first>\d{1,2})(?P=sep)(?P<year_last>\d{4})'
+    )
+    
+    # Dotted abbreviations that mean a title is not a filename
+    TITLE_ABBREVIATIONS = ("Mr.", "Dr.", "Ph.D")
+    # Paths already carrying one of these schemes are used as-is
+    URL_PREFIXES = ("http://", "https://", "file://")
+    # Constant content blocks, shared by every page: must not be modified
+    EMPTY_PARAGRAPH_BLOCK = {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {"rich_text": []}
+    }
+    NO_DESCRIPTION_BLOCK = {
+        "object": "block",
+        "type": "paragraph",
+        "paragraph": {
+            "rich_text": [{"type": "text", "text": {"content": "Sem descrição disponível."}}]
+        }
+    }
+    # Static schema returned by get_property_maps
+    PROPERTY_MAPS = [
+        {"notion_property": "Title", "csv_columns": ["GB_Titulo", "Titulo_Extraido", "Nome"]},
+        {"notion_property": "Author", "csv_columns": ["GB_Autores", "Autor_Extraido"]},
+        {"notion_property": "Format", "csv_columns": ["Formato"]},
+        {"notion_property": "Size (MB)", "csv_columns": ["Tamanho(MB)"]},
+        {"notion_property": "Modified Date", "csv_columns": ["Data Modificação"]},
+        {"notion_property": "Path", "csv_columns": ["Caminho"]},
+        {"notion_property": "Publisher", "csv_columns": ["GB_Editora"]},
+        {"notion_property": "Publication Date", "csv_columns": ["GB_Data_Publicacao"]},
+        {"notion_property": "ISBN", "csv_columns": ["GB_ISBN13", "GB_ISBN10"]},
+        {"notion_property": "Topics", "csv_columns": ["Temas_Sugeridos", "GB_Categorias"]}
+    ]
+    
     def __init__(self):
         """Initializes the mapper."""
         self.logger = logging.getLogger(__name__)
+        # Select properties are shared between pages: formats have few distinct values
+        self._select_cache: Dict[Any, Dict[str, Any]] = {}
     
     def map_to_notion_properties(self, record: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -25,64 +70,61 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
         Returns:
             Dictionary of Notion properties
         """
-        properties = {}
+        # Each column is looked up once; priorities are plain `or` chains
+        get = record.get
         
         # Title (GB_Titulo > Titulo_Extraido > Nome)
-        title = self._get_value_by_priority(record, ["GB_Titulo", "Titulo_Extraido", "Nome"], "")
-        if title and isinstance(title, str) and "." in title and not any(substring in title for substring in ["Mr.", "Dr.", "Ph.D"]):
+        title = get("GB_Titulo") or get("Titulo_Extraido") or get("Nome") or ""
+        if title and isinstance(title, str) and "." in title and not any(abbr in title for abbr in self.TITLE_ABBREVIATIONS):
             # Try to extract title from filename if it looks like a filename
-            title = title.split('.')[0]
-            
-        properties["Title"] = self._format_title_property(title)
+            title = title.partition('.')[0]
         
         # Author (GB_Autores > Autor_Extraido > "Unknown")
-        author = self._get_value_by_priority(record, ["GB_Autores", "Autor_Extraido"], "Unknown")
-        properties["Author"] = self._format_text_property(author)
+        author = get("GB_Autores") or get("Autor_Extraido") or "Unknown"
         
-        # Format
-        format_value = record.get("Formato", "Unknown")
-        properties["Format"] = self._format_select_property(format_value)
+        # Properties every page has; Reading Status defaults to "Unread"
+        properties = {
+            "Title": self._format_title_property(title),
+            "Author": self._format_text_property(author),
+            "Format": self._format_select_property(get("Formato", "Unknown")),
+            "Reading Status": self._format_select_property("Unread")
+        }
         
         # Size
-        if "Tamanho(MB)" in record:
+        size_str = get("Tamanho(MB)")
+        if size_str is not None:
             try:
-                size = float(record["Tamanho(MB)"])
-                properties["Size (MB)"] = self._format_number_property(size)
+                properties["Size (MB)"] = self._format_number_property(float(size_str))
             except (ValueError, TypeError):
                 pass
         
         # Modified Date
-        if "Data Modificação" in record:
+        date_str = get("Data Modificação")
+        if date_str:
             try:
-                date_str = record["Data Modificação"]
-                date_obj = self._parse_date(date_str)
+                date_obj = self.parse_date(date_str)
                 if date_obj:
                     properties["Modified Date"] = self._format_date_property(date_obj)
             except Exception as e:
-                self.logger.warning(f"Error parsing date: {str(e)}")
+                self.logger.warning("Error parsing date: %s", e)
         
         # Path
-        path = record.get("Caminho", "")
+        path = get("Caminho", "")
         if path:
-            if not path.startswith(("http://", "https://", "file://")):
+            if not path.startswith(self.URL_PREFIXES):
                 path = f"file://{path}"
             properties["Path"] = self._format_url_property(path)
         
-        # Reading Status - Default to "Unread"
-        properties["Reading Status"] = self._format_select_property("Unread")
-        
-        # Publisher (GB_Editora > "Unknown")
-        publisher = self._get_value_by_priority(record, ["GB_Editora"], "")
+        # Publisher, Publication Date and ISBN (only when present)
+        publisher = get("GB_Editora")
         if publisher:
             properties["Publisher"] = self._format_text_property(publisher)
         
-        # Publication Date (GB_Data_Publicacao)
-        pub_date = self._get_value_by_priority(record, ["GB_Data_Publicacao"], "")
+        pub_date = get("GB_Data_Publicacao")
         if pub_date:
             properties["Publication Date"] = self._format_text_property(pub_date)
         
-        # ISBN (GB_ISBN13 > GB_ISBN10)
-        isbn = self._get_value_by_priority(record, ["GB_ISBN13", "GB_ISBN10"], "")
+        isbn = get("GB_ISBN13") or get("GB_ISBN10")
         if isbn:
             properties["ISBN"] = self._format_text_property(isbn)
         
@@ -107,7 +149,7 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
         properties = self.map_to_notion_properties(record)
         
         # Extract URL of the cover for icon and cover image
-        cover_url_raw = self._get_value_by_priority(record, ["GB_Capa_Link"], None)
+        cover_url_raw = record.get("GB_Capa_Link") or None
         cover_url = self._normalize_image_url(cover_url_raw)
 
         icon = None
@@ -130,10 +172,10 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
                 }
             }
 
-            self.logger.debug(f"Set cover image as icon and page cover: {cover_url}")
+            self.logger.debug("Set cover image as icon and page cover: %s", cover_url)
         else:
             if cover_url_raw:
-                self.logger.warning(f"Invalid cover URL format for icon/cover: {cover_url_raw}")
+                self.logger.warning("Invalid cover URL format for icon/cover: %s", cover_url_raw)
 
         return properties, icon, cover
     
@@ -153,7 +195,7 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
         blocks = []
         
         # Título como cabeçalho H1
-        title = self._get_value_by_priority(record, ["GB_Titulo", "Titulo_Extraido", "Nome"], "")
+        title = record.get("GB_Titulo") or record.get("Titulo_Extraido") or record.get("Nome")
         if title:
             blocks.append({
                 "object": "block",
@@ -162,16 +204,12 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
                     "rich_text": [{"type": "text", "text": {"content": title}}]
                 }
             })
-            self.logger.debug(f"Added title header: {title}")
+            self.logger.debug("Added title header: %s", title)
         
         # Bloco vazio para espaçamento
-        blocks.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {"rich_text": []}
-        })
+        blocks.append(self.EMPTY_PARAGRAPH_BLOCK)
 
-        preview_link_raw = self._get_value_by_priority(record, ["GB_Preview_Link"], None)
+        preview_link_raw = record.get("GB_Preview_Link") or None
         preview_link = self._normalize_image_url(preview_link_raw)
 
         # Adicionar link de prévia do Google Books se disponível
@@ -186,29 +224,28 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
                     ]
                 }
             })
-            self.logger.debug(f"Added Google Books preview link: {preview_link}")
+            self.logger.debug("Added Google Books preview link: %s", preview_link)
         
         # Bloco vazio para espaçamento
-        blocks.append({
-            "object": "block",
-            "type": "paragraph",
-            "paragraph": {"rich_text": []}
-        })
+        blocks.append(self.EMPTY_PARAGRAPH_BLOCK)
         
         # Descrição/sumário do livro
-        description = self._get_value_by_priority(record, ["GB_Descricao"], None)
+        description = record.get("GB_Descricao") or None
         if description:
              # Add this code to split long descriptions into chunks of 2000 chars max
             if len(description) > 2000:
-                # Split description into chunks of 2000 chars or less
-                chunks = [description[i:i+1900] for i in range(0, len(description), 1900)]
+                # Split description into chunks of 2000 chars or less, slicing
+                # each one only when its block is built
+                length = len(description)
+                last_start = (length - 1) // 1900 * 1900
+                chunk_count = last_start // 1900 + 1
                 
-                self.logger.debug(f"Description length {len(description)} chars - splitting into {len(chunks)} blocks")
+                self.logger.debug("Description length %s chars - splitting into %s blocks", length, chunk_count)
                 
-                for i, chunk in enumerate(chunks):
+                for start in range(0, length, 1900):
                     # Add ellipsis for continuity
-                    suffix = "..." if i < len(chunks) - 1 else ""
-                    prefix = "..." if i > 0 else ""
+                    prefix = "..." if start else ""
+                    suffix = "..." if start < last_start else ""
                     
                     blocks.append({
                         "object": "block",
@@ -216,11 +253,11 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
                         "paragraph": {
                             "rich_text": [{
                                 "type": "text", 
-                                "text": {"content": prefix + chunk + suffix}
+                                "text": {"content": f"{prefix}{description[start:start + 1900]}{suffix}"}
                             }]
                         }
                     })
-                self.logger.debug(f"Added book description in {len(chunks)} chunks")
+                self.logger.debug("Added book description in %s chunks", chunk_count)
             else:
                 # Original code for descriptions under 2000 chars
                 blocks.append({
@@ -230,58 +267,51 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
                         "rich_text": [{"type": "text", "text": {"content": description}}]
                     }
                 })
-                self.logger.debug(f"Added book description ({len(description)} chars)")
+                self.logger.debug("Added book description (%s chars)", len(description))
         else:
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {
-                    "rich_text": [{"type": "text", "text": {"content": "Sem descrição disponível."}}]
-                }
-            })
+            blocks.append(self.NO_DESCRIPTION_BLOCK)
             self.logger.debug("No description available, added placeholder text")
         
         # Informações adicionais
-        if "GB_Editora" in record and record["GB_Editora"]:
+        publisher = record.get("GB_Editora")
+        if publisher:
             blocks.append({
                 "object": "block",
                 "type": "paragraph",
                 "paragraph": {
                     "rich_text": [
                         {"type": "text", "text": {"content": "Editora: "}, "annotations": {"bold": True}},
-                        {"type": "text", "text": {"content": record["GB_Editora"]}}
+                        {"type": "text", "text": {"content": publisher}}
                     ]
                 }
             })
         
-        if "GB_Data_Publicacao" in record and record["GB_Data_Publicacao"]:
+        pub_date = record.get("GB_Data_Publicacao")
+        if pub_date:
             blocks.append({
                 "object": "block",
                 "type": "paragraph",
                 "paragraph": {
                     "rich_text": [
                         {"type": "text", "text": {"content": "Publicação: "}, "annotations": {"bold": True}},
-                        {"type": "text", "text": {"content": record["GB_Data_Publicacao"]}}
+                        {"type": "text", "text": {"content": pub_date}}
                     ]
                 }
             })
 
         # Add image block at the END of the page
         # This is after all text content has been added
-        cover_url_raw = self._get_value_by_priority(record, ["GB_Capa_Link"], None)
+        cover_url_raw = record.get("GB_Capa_Link") or None
+        cover_url_stripped = cover_url_raw.strip() if cover_url_raw else None
 
-        if cover_url_raw and cover_url_raw.strip():
+        if cover_url_stripped:
             # Convert HTTP to HTTPS
-            cover_url_for_api = cover_url_raw.strip()
+            cover_url_for_api = cover_url_stripped
             if cover_url_for_api.startswith("http://"):
-                cover_url_for_api = cover_url_for_api.replace("http://", "https://", 1)
+                cover_url_for_api = "https://" + cover_url_for_api[7:]
 
             # Add spacing before image
-            blocks.append({
-                "object": "block",
-                "type": "paragraph",
-                "paragraph": {"rich_text": []}
-            })
+            blocks.append(self.EMPTY_PARAGRAPH_BLOCK)
 
             # Add the image block
             image_block = {
@@ -295,7 +325,7 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
                 }
             }
             blocks.append(image_block)
-            self.logger.info(f"Added image block at END - Original: {cover_url_raw.strip()}, API: {cover_url_for_api}")
+            self.logger.info("Added image block at END - Original: %s, API: %s", cover_url_stripped, cover_url_for_api)
 
         return blocks
     
@@ -304,72 +334,55 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
         Gets the property mappings used by this mapper.
         
         Returns:
-            List of property mapping definitions
+            List of property mapping definitions (shared, do not modify)
         """
-        return [
-            {"notion_property": "Title", "csv_columns": ["GB_Titulo", "Titulo_Extraido", "Nome"]},
-            {"notion_property": "Author", "csv_columns": ["GB_Autores", "Autor_Extraido"]},
-            {"notion_property": "Format", "csv_columns": ["Formato"]},
-            {"notion_property": "Size (MB)", "csv_columns": ["Tamanho(MB)"]},
-            {"notion_property": "Modified Date", "csv_columns": ["Data Modificação"]},
-            {"notion_property": "Path", "csv_columns": ["Caminho"]},
-            {"notion_property": "Publisher", "csv_columns": ["GB_Editora"]},
-            {"notion_property": "Publication Date", "csv_columns": ["GB_Data_Publicacao"]},
-            {"notion_property": "ISBN", "csv_columns": ["GB_ISBN13", "GB_ISBN10"]},
-            {"notion_property": "Topics", "csv_columns": ["Temas_Sugeridos", "GB_Categorias"]}
-        ]
-    
-    def _get_value_by_priority(self, record: Dict[str, Any], keys: List[str], default: Any = "") -> Any:
-        """Gets the first non-empty value from the list of keys."""
-        for key in keys:
-            if key in record and record[key]:
-                return record[key]
-        return default
+        return self.PROPERTY_MAPS
     
     def _get_topics(self, record: Dict[str, Any]) -> List[str]:
-        """Extracts topics from the record."""
-        topics = []
-        
-        # Try Temas_Sugeridos first
-        if "Temas_Sugeridos" in record and record["Temas_Sugeridos"]:
-            topics_str = record["Temas_Sugeridos"]
-            topics.extend(self._split_topics(topics_str))
-        
-        # Then try GB_Categorias
-        elif "GB_Categorias" in record and record["GB_Categorias"]:
-            topics_str = record["GB_Categorias"]
-            topics.extend(self._split_topics(topics_str))
+        """Extracts topics from the record, deduplicated in their original order."""
+        # Try Temas_Sugeridos first, then GB_Categorias
+        topics_str = record.get("Temas_Sugeridos") or record.get("GB_Categorias")
+        if not topics_str:
+            return []
         
-        # Deduplicate and return
-        return list(set(topics))
+        return list(dict.fromkeys(self._split_topics(topics_str)))
     
     def _split_topics(self, topics_str: str) -> List[str]:
         """Splits a comma/semicolon-separated string into a list of topics."""
-        topics = []
-        for topic in re.split(r'[,;]', topics_str):
-            topic = topic.strip()
-            if topic:
-                topics.append(topic)
-        return topics
+        if ';' in topics_str:
+            topics_str = topics_str.translate(self.TOPIC_SEPARATORS)
+        parts = topics_str.split(',')
+        return [topic for topic in (t.strip() for t in parts) if topic]
     
-    def _parse_date(self, date_str: str) -> Optional[datetime]:
-        """Parses a date string into a datetime object."""
-        formats = [
-            '%Y-%m-%d %H:%M:%S',
-            '%Y-%m-%d',
-            '%Y-%m-%d %H:%M',
-            '%d/%m/%Y',
-            '%d-%m-%Y',
-            '%Y/%m/%d'
-        ]
-        
-        for fmt in formats:
-            try:
-                return datetime.strptime(date_str, fmt)
-            except ValueError:
-                continue
+    def parse_date(self, date_str: str) -> Optional[datetime]:
+        """
+        Parses a modification date from the CSV into a datetime object.
+
+        Also used by the legacy NotionExporter, so both exporters accept the
+        same date layouts (see DATE_PATTERN).
+
+        Args:
+            date_str: Date string from the CSV
+
+        Returns:
+            Parsed datetime, or None if the string is not a valid date
+        """
+        match = self.DATE_PATTERN.fullmatch(date_str)
+        if not match:
+            return None
         
-        return None
+        year, month, day, hour, minute, second, year_slash, month_slash, day_slash, \
+            day_first, _, month_first, year_last = match.groups()
+        try:
+            if year:
+                return datetime(int(year), int(month), int(day),
+                                int(hour or 0), int(minute or 0), int(second or 0))
+            if year_slash:
+                return datetime(int(year_slash), int(month_slash), int(day_slash))
+            return datetime(int(year_last), int(month_first), int(day_first))
+        except ValueError:
+            # Matched the shape but not a real date (e.g. month 13)
+            return None
     
     # Notion property formatters
     def _format_title_property(self, value: str) -> Dict[str, Any]:
@@ -379,7 +392,11 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
         return {"rich_text": [{"type": "text", "text": {"content": str(value)}}]}
     
     def _format_select_property(self, value: str) -> Dict[str, Any]:
-        return {"select": {"name": value}}
+        # Cached and shared between records: callers must not modify the result
+        prop = self._select_cache.get(value)
+        if prop is None:
+            prop = self._select_cache[value] = {"select": {"name": value}}
+        return prop
     
     def _format_multi_select_property(self, values: List[str]) -> Dict[str, Any]:
         return {"multi_select": [{"name": value} for value in values]}
@@ -403,16 +420,16 @@ class GoogleBooksNotionRecordMapper(NotionRecordMapper):
         Returns:
             Normalized HTTPS URL or None if invalid
         """
-        if not url or not url.strip():
+        if not url:
             return None
 
         url = url.strip()
 
         # Convert HTTP to HTTPS (Notion requires HTTPS)
         if url.startswith("http://"):
-            url = url.replace("http://", "https://", 1)
+            return "https://" + url[7:]
 
-        # Validate it's a valid HTTPS URL
+        # Validate it's a valid HTTPS URL (also rejects blank strings)
         if url.startswith("https://"):
             return url
 
@@ -1,13 +1,57 @@
 import logging
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import csv
-from typing import Dict, Any, Optional, List
+import io
+import random
+import re
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, Optional, List, Iterator
 from core.interfaces.exporter import Exporter
+from adapters.notion.record_mapper import GoogleBooksNotionRecordMapper
+from utils.csv_utils import count_csv_rows
+
+try:
+    import orjson  # Opcional: serialização mais rápida do payload
+except ImportError:
+    orjson = None
 
 class NotionExporter(Exporter):
     """Exportador para o Notion."""
     
+    MAX_WORKERS = 4  # Linhas do CSV enviadas em paralelo (padrão de "notion_concurrency")
+    MAX_PENDING = 16  # Linhas lidas do CSV à frente dos envios (limita a memória)
+    # Propriedades de texto opcionais: (coluna do CSV, propriedade do Notion);
+    # a primeira coluna preenchida de cada propriedade é a usada
+    TEXT_FIELDS = (
+        ("GB_Editora", "Editora"),
+        ("GB_ISBN13", "ISBN"),
+        ("GB_ISBN10", "ISBN")
+    )
+    # Colunas que geram conteúdo útil na página (descrição, prévia, editora, ...);
+    # GB_Capa_Link não conta: a capa vai como ícone, não como bloco de conteúdo
+    ENRICHING_COLUMNS = ("GB_Descricao", "GB_Preview_Link", "GB_Editora", "GB_Data_Publicacao")
+    # Datas de publicação do Google Books: ano, ano-mês ou data completa
+    PUB_DATE_PATTERN = re.compile(r'(\d{4})(?:-(\d{2})(?:-(\d{2}))?)?')
+    ICON_URL_PREFIXES = ("http://", "https://")
+    REQUEST_TIMEOUT = 30  # Segundos de espera por uma resposta da API
+    MAX_RETRIES = 5  # Novas tentativas para falhas temporárias
+    # Respostas em que o Notion não processou a requisição: repetir não duplica a página
+    RETRY_STATUS_CODES = {429, 503}
+    MAX_RETRY_DELAY = 30  # Segundos, teto do backoff exponencial
+    REQUEST_INTERVAL = 1 / 3  # A API do Notion aceita ~3 requisições/s por integração
+    # Colunas do CSV lidas por add_ebook; as demais não são carregadas
+    CSV_COLUMNS = (
+        "Nome", "Caminho", "Formato", "Tamanho(MB)", "Data Modificação", "Temas",
+        "Titulo_Extraido", "Autor_Extraido", "GB_Titulo", "GB_Autores", "GB_Editora",
+        "GB_Data_Publicacao", "GB_ISBN13", "GB_ISBN10", "GB_Paginas", "GB_Categorias",
+        "GB_Capa_Link", "GB_Preview_Link", "GB_Descricao"
+    )
+    
     def __init__(self, token: Optional[str] = None, database_id: Optional[str] = None):
         """
         Inicializa o exportador do Notion.
@@ -24,6 +68,19 @@ class NotionExporter(Exporter):
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28"
         }
+        # Sessão reutiliza a conexão HTTPS (keep-alive) entre as requisições
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.max_workers = self.MAX_WORKERS
+        self._mount_adapter()
+        self._request_lock = threading.Lock()
+        self._last_request_time = 0.0
+        # Propriedades select são compartilhadas entre as páginas (poucos valores distintos)
+        self._select_cache: Dict[str, Dict[str, Any]] = {}
+        # Opções de multi_select dos temas, que se repetem em todo o catálogo
+        self._tema_cache: Dict[str, Dict[str, str]] = {}
+        # Mesmo parser de datas do exportador novo (adapters/notion)
+        self._record_mapper = GoogleBooksNotionRecordMapper()
         self.logger = logging.getLogger(__name__)
     
     def export(self, csv_path: str, config: Optional[Dict[str, Any]] = None) -> bool:
@@ -42,8 +99,12 @@ class NotionExporter(Exporter):
             if 'token' in config:
                 self.token = config['token']
                 self.headers["Authorization"] = f"Bearer {self.token}"
+                self.session.headers["Authorization"] = self.headers["Authorization"]
             if 'database_id' in config:
                 self.database_id = config['database_id']
+            if 'notion_concurrency' in config:
+                self.max_workers = max(1, int(config['notion_concurrency']))
+                self._mount_adapter()
             # Aplicar configurações avançadas
             self.include_cover = config.get("include_cover", True)
             self.include_description = config.get("include_description", True)
@@ -58,6 +119,24 @@ class NotionExporter(Exporter):
         except Exception as e:
             self.logger.error(f"Erro ao exportar para o Notion: {str(e)}")
             return False
+        finally:
+            # Libera as conexões keep-alive; a sessão reabre o pool se for usada de novo
+            self.close()
+    
+    def _mount_adapter(self) -> None:
+        """
+        Dimensiona o pool de conexões da sessão para as threads de envio.
+        """
+        # Fechar o pool anterior (ao mudar notion_concurrency) para não deixar conexões abertas
+        self.session.get_adapter("https://").close()
+        # Uma conexão por thread de envio, todas para api.notion.com
+        self.session.mount("https://", HTTPAdapter(pool_connections=1, pool_maxsize=max(10, self.max_workers)))
+    
+    def close(self) -> None:
+        """
+        Fecha as conexões mantidas pela sessão HTTP.
+        """
+        self.session.close()
     
     def add_ebook(self, ebook_data: Dict[str, Any]) -> Optional[str]:
         """
@@ -79,6 +158,11 @@ class NotionExporter(Exporter):
         titulo = (ebook_data.get("GB_Titulo", "") or 
                   ebook_data.get("Titulo_Extraido", "") or 
                   ebook_data.get("Nome", "").split('.')[0])
+        
+        # Sem título o Notion recusaria a página: descartar antes de montar o payload
+        if not titulo.strip():
+            self.logger.warning(f"Linha sem título ignorada: {ebook_data.get('Nome', '')!r}")
+            return None
                   
         autor = (ebook_data.get("GB_Autores", "") or 
                  ebook_data.get("Autor_Extraido", "") or 
@@ -98,49 +182,22 @@ class NotionExporter(Exporter):
         
         # Converter data
         date_str = ebook_data.get("Data Modificação", "")
-        date_formatted = None
-        if date_str:
-            try:
-                date_parts = date_str.split(" ")
-                date_formatted = f"{date_parts[0]}T{date_parts[1] if len(date_parts) > 1 else '00:00:00'}.000Z"
-            except:
-                date_formatted = None
+        date_obj = self._record_mapper.parse_date(date_str) if date_str else None
+        date_formatted = f"{date_obj.isoformat()}.000Z" if date_obj else None
         
         # Preparar payload básico
         payload = {
             "parent": {"database_id": self.database_id},
             "properties": {
-                "Título": {
-                    "title": [
-                        {
-                            "type": "text",
-                            "text": {"content": titulo}
-                        }
-                    ]
-                },
-                "Autor": {
-                    "rich_text": [
-                        {
-                            "type": "text",
-                            "text": {"content": autor}
-                        }
-                    ]
-                },
-                "Formato": {
-                    "select": {
-                        "name": formato
-                    }
-                },
-                "Status de Leitura": {
-                    "select": {
-                        "name": "Não Lido"  # Valor padrão
-                    }
-                }
+                "Título": {"title": self._rich_text(titulo)},
+                "Autor": self._text_prop(autor),
+                "Formato": self._select_prop(formato),
+                "Status de Leitura": self._select_prop("Não Lido")  # Valor padrão
             }
         }
         
-        # Adicionar ícone de capa se disponível
-        if cover_url:
+        # Adicionar ícone de capa se disponível (o Notion só aceita ícones http/https)
+        if cover_url and cover_url.startswith(self.ICON_URL_PREFIXES):
             payload["icon"] = {
                 "type": "external",
                 "external": {
@@ -149,84 +206,69 @@ class NotionExporter(Exporter):
             }
         
         # Adicionar propriedades opcionais
-        if "Tamanho(MB)" in ebook_data:
+        properties = payload["properties"]
+        get = ebook_data.get
+        
+        tamanho = get("Tamanho(MB)")
+        if tamanho is not None:
             try:
-                tamanho = float(ebook_data["Tamanho(MB)"])
-                payload["properties"]["Tamanho (MB)"] = {"number": tamanho}
+                properties["Tamanho (MB)"] = {"number": float(tamanho)}
             except (ValueError, TypeError):
                 pass
                 
         if date_formatted:
-            payload["properties"]["Data de Modificação"] = {"date": {"start": date_formatted}}
+            properties["Data de Modificação"] = {"date": {"start": date_formatted}}
             
         if url_value:
-            payload["properties"]["Caminho"] = {"url": url_value}
+            properties["Caminho"] = {"url": url_value}
         
         # Adicionar propriedades do Google Books quando disponíveis
-        if "GB_Editora" in ebook_data and ebook_data["GB_Editora"]:
-            payload["properties"]["Editora"] = {
-                "rich_text": [{"type": "text", "text": {"content": ebook_data["GB_Editora"]}}]
-            }
+        for column, prop_name in self.TEXT_FIELDS:
+            value = get(column)
+            if value and prop_name not in properties:
+                properties[prop_name] = self._text_prop(value)
             
-        if "GB_Data_Publicacao" in ebook_data and ebook_data["GB_Data_Publicacao"]:
-            try:
-                # Tentar converter para data Notion
-                pub_date = ebook_data["GB_Data_Publicacao"]
-                # Se for apenas ano, adicionar mês e dia
-                if len(pub_date) == 4 and pub_date.isdigit():
-                    pub_date = f"{pub_date}-01-01"
-                
-                payload["properties"]["Data de Publicação"] = {"date": {"start": pub_date}}
-            except:
-                # Em caso de erro, adicionar como texto
-                payload["properties"]["Ano de Publicação"] = {
-                    "rich_text": [{"type": "text", "text": {"content": ebook_data["GB_Data_Publicacao"]}}]
-                }
-        
-        if "GB_ISBN13" in ebook_data and ebook_data["GB_ISBN13"]:
-            payload["properties"]["ISBN"] = {
-                "rich_text": [{"type": "text", "text": {"content": ebook_data["GB_ISBN13"]}}]
-            }
-        elif "GB_ISBN10" in ebook_data and ebook_data["GB_ISBN10"]:
-            payload["properties"]["ISBN"] = {
-                "rich_text": [{"type": "text", "text": {"content": ebook_data["GB_ISBN10"]}}]
-            }
+        pub_date = get("GB_Data_Publicacao")
+        match = self.PUB_DATE_PATTERN.fullmatch(pub_date) if pub_date else None
+        if match:
+            # Completar mês e dia ausentes (ex.: apenas o ano)
+            year, month, day = match.groups()
+            properties["Data de Publicação"] = {"date": {"start": f"{year}-{month or '01'}-{day or '01'}"}}
             
-        if "GB_Paginas" in ebook_data and ebook_data["GB_Paginas"]:
+        paginas = get("GB_Paginas")
+        if paginas:
             try:
-                payload["properties"]["Páginas"] = {"number": int(ebook_data["GB_Paginas"])}
-            except:
+                properties["Páginas"] = {"number": int(paginas)}
+            except (ValueError, TypeError):
                 pass
         
-        # Adicionar temas/categorias
-        temas = []
-        # Primeiro verificar categorias do Google Books
-        if "GB_Categorias" in ebook_data and ebook_data["GB_Categorias"]:
-            for tema in ebook_data["GB_Categorias"].split(','):
-                tema = tema.strip()
-                if tema:
-                    temas.append({"name": tema})
-        # Depois verificar temas extraídos normalmente
-        elif "Temas" in ebook_data and ebook_data["Temas"]:
-            for tema in ebook_data["Temas"].split(','):
-                tema = tema.strip()
-                if tema:
-                    temas.append({"name": tema})
-        
-        if temas:
-            payload["properties"]["Temas"] = {"multi_select": temas}
+        # Adicionar temas/categorias: primeiro categorias do Google Books,
+        # depois temas extraídos normalmente
+        temas_str = get("GB_Categorias") or get("Temas")
+        if temas_str:
+            temas = [self._tema_option(tema) for tema in (t.strip() for t in temas_str.split(',')) if tema]
+            if temas:
+                properties["Temas"] = {"multi_select": temas}
+        
+        # Conteúdo da página vai na própria criação (children), sem uma segunda requisição;
+        # sem dados do Google Books ele teria só o título e um aviso de descrição ausente
+        if self._has_enriching_content(ebook_data):
+            payload["children"] = self._content_blocks(ebook_data)
         
+        response = None
         try:
-            # Criar a página básica
-            response = requests.post(url, headers=self.headers, json=payload)
+            # Criar a página com o conteúdo
+            response = self._post_with_retry(url, payload)
+            if response.status_code == 400 and "children" in payload:
+                # Um bloco recusado (ex.: imagem externa) não deve impedir a criação da página
+                self.logger.warning(f"Conteúdo recusado para '{titulo}', criando a página sem conteúdo: {response.text}")
+                del payload["children"]
+                response = self._post_with_retry(url, payload)
             response.raise_for_status()
             result = response.json()
             page_id = result["id"]
             self.logger.info(f"Ebook adicionado com sucesso: {titulo}")
             
-            # Adicionar conteúdo à página
-            self._add_page_content(page_id, ebook_data)
-            
             return page_id
         except requests.exceptions.RequestException as e:
             self.logger.error(f"Erro ao adicionar ebook '{titulo}': {str(e)}")
@@ -252,24 +294,20 @@ class NotionExporter(Exporter):
         error_count = 0
         
         try:
-            with open(csv_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                total_rows = sum(1 for _ in open(csv_path, 'r', encoding='utf-8')) - 1  # -1 para cabeçalho
+            # Uma única abertura: a contagem devolve a posição de leitura ao início
+            with open(csv_path, 'rb') as raw:
+                total_rows = count_csv_rows(raw)
+                reader = self._iter_rows(io.TextIOWrapper(raw, encoding='utf-8', newline=''))
                 
                 self.logger.info(f"Iniciando importação de {total_rows} ebooks do arquivo {csv_path}")
                 
-                for i, row in enumerate(reader):
-                    try:
-                        page_id = self.add_ebook(row)
-                        if page_id:
+                # Envio é limitado pela rede: as linhas são enviadas em paralelo
+                with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                    for imported in self._import_rows(executor, reader, total_rows):
+                        if imported:
                             success_count += 1
                         else:
                             error_count += 1
-                            
-                        self.logger.info(f"Progresso: {i+1}/{total_rows} - {row.get('Nome', 'Sem nome')}")
-                    except Exception as e:
-                        self.logger.error(f"Erro ao importar linha {i+1}: {str(e)}")
-                        error_count += 1
                 
                 self.logger.info(f"Importação concluída. {success_count}/{total_rows} ebooks importados com sucesso. {error_count} erros.")
                 
@@ -277,4 +315,185 @@ class NotionExporter(Exporter):
                 
         except Exception as e:
             self.logger.error(f"Erro ao ler arquivo CSV: {str(e)}")
-            return False
\ No newline at end of file
+            return False
+    
+    def _import_rows(self, executor: ThreadPoolExecutor, rows: Iterator[Dict[str, Any]], total_rows: int) -> Iterator[bool]:
+        """
+        Envia as linhas pelo executor mantendo no máximo MAX_PENDING em andamento.
+        
+        Diferente de executor.map, que agenda (e lê) todas as linhas do CSV de uma
+        vez, a leitura e o mapeamento das próximas linhas acompanham os envios.
+        
+        Args:
+            executor: Executor que faz os envios
+            rows: Linhas do CSV
+            total_rows: Total de linhas, para o log de progresso
+            
+        Returns:
+            Iterador com o resultado de cada linha, na ordem do CSV
+        """
+        max_pending = max(self.MAX_PENDING, 2 * self.max_workers)  # Mantém todas as threads ocupadas
+        pending = deque()
+        for i, row in enumerate(rows):
+            pending.append(executor.submit(self._import_row, i, row, total_rows))
+            if len(pending) >= max_pending:
+                yield pending.popleft().result()
+        
+        while pending:
+            yield pending.popleft().result()
+    
+    def _import_row(self, i: int, row: Dict[str, Any], total_rows: int) -> bool:
+        """
+        Importa uma linha do CSV para o Notion.
+        
+        Args:
+            i: Índice da linha (a partir de 0)
+            row: Dados da linha
+            total_rows: Total de linhas, para o log de progresso
+            
+        Returns:
+            True se o ebook foi adicionado, False caso contrário
+        """
+        try:
+            page_id = self.add_ebook(row)
+            self.logger.info(f"Progresso: {i+1}/{total_rows} - {row.get('Nome', 'Sem nome')}")
+            return bool(page_id)
+        except Exception as e:
+            self.logger.error(f"Erro ao importar linha {i+1}: {str(e)}")
+            return False
+    
+    def _iter_rows(self, file) -> Iterator[Dict[str, str]]:
+        """
+        Lê as linhas do CSV com csv.reader, mantendo apenas as colunas usadas.
+        
+        Evita o dicionário completo que o csv.DictReader monta para cada linha:
+        as posições das colunas são resolvidas uma vez a partir do cabeçalho.
+        
+        Args:
+            file: Arquivo CSV aberto
+            
+        Returns:
+            Iterador de dicionários com as colunas de CSV_COLUMNS presentes na linha
+        """
+        reader = csv.reader(file)
+        header = next(reader, None)
+        if not header:
+            return
+        
+        positions = {name: i for i, name in enumerate(header)}
+        columns = [(name, positions[name]) for name in self.CSV_COLUMNS if name in positions]
+        
+        for row in reader:
+            if not row:
+                continue  # Linhas em branco, como no DictReader
+            width = len(row)
+            yield {name: row[i] for name, i in columns if i < width}
+    
+    def _content_blocks(self, ebook_data: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Monta os blocos de conteúdo da página sem os blocos de imagem.
+        
+        O Notion recusa as URLs do Google Books em blocos de imagem (a capa já vai
+        como ícone); enviá-las faria a criação falhar e ser repetida sem conteúdo.
+        
+        Args:
+            ebook_data: Dicionário com dados do ebook
+            
+        Returns:
+            Lista de blocos aceitos pelo Notion
+        """
+        blocks = [
+            block for block in self._record_mapper.create_page_content_blocks(ebook_data)
+            if block.get("type") != "image"
+        ]
+        # Espaçamento que antecedia a imagem, no fim da página
+        while blocks and blocks[-1] is self._record_mapper.EMPTY_PARAGRAPH_BLOCK:
+            blocks.pop()
+        return blocks
+    
+    def _has_enriching_content(self, ebook_data: Dict[str, Any]) -> bool:
+        """Indica se a linha tem algum dado que enriquece o conteúdo da página."""
+        return any(ebook_data.get(column) for column in self.ENRICHING_COLUMNS)
+    
+    def _rich_text(self, content: str) -> List[Dict[str, Any]]:
+        """Monta o rich_text de um único trecho de texto."""
+        return [{"type": "text", "text": {"content": content}}]
+    
+    def _text_prop(self, value: str) -> Dict[str, Any]:
+        """Monta uma propriedade rich_text do Notion."""
+        return {"rich_text": self._rich_text(value)}
+    
+    def _select_prop(self, name: str) -> Dict[str, Any]:
+        """Monta (uma vez por valor) uma propriedade select; o resultado não deve ser modificado."""
+        prop = self._select_cache.get(name)
+        if prop is None:
+            prop = self._select_cache[name] = {"select": {"name": name}}
+        return prop
+    
+    def _tema_option(self, name: str) -> Dict[str, str]:
+        """Monta (uma vez por tema) uma opção de multi_select; o resultado não deve ser modificado."""
+        option = self._tema_cache.get(name)
+        if option is None:
+            option = self._tema_cache[name] = {"name": name}
+        return option
+    
+    def _post_with_retry(self, url: str, payload: Dict[str, Any]) -> requests.Response:
+        """
+        Envia um POST à API, repetindo falhas temporárias com backoff exponencial.
+        
+        Criar uma página não é idempotente, então só são repetidas as falhas em
+        que a requisição não chegou a ser processada: erros de conexão (inclusive
+        ConnectTimeout) e respostas 429 e 503. Timeouts de leitura e os demais 5xx
+        não são repetidos, pois a página pode já ter sido criada e uma nova
+        tentativa a duplicaria; o erro é devolvido a quem chamou.
+        
+        Entre as tentativas espera o Retry-After informado pelo Notion ou
+        2^tentativa segundos (com jitter, até MAX_RETRY_DELAY), o que for maior.
+        
+        Args:
+            url: URL do endpoint
+            payload: Corpo JSON da requisição
+            
+        Returns:
+            Resposta da última tentativa
+            
+        Raises:
+            requests.exceptions.ConnectionError: Se a conexão falhar em todas as tentativas
+            requests.exceptions.ReadTimeout: Se o Notion não responder a tempo (sem nova tentativa)
+        """
+        if orjson is not None:
+            # Content-Type já é application/json nos cabeçalhos da sessão
+            body = {"data": orjson.dumps(payload)}
+        else:
+            body = {"json": payload}
+        
+        for attempt in range(self.MAX_RETRIES + 1):
+            retry_after = 0.0
+            self._throttle_request()
+            try:
+                response = self.session.post(url, timeout=self.REQUEST_TIMEOUT, **body)
+            except requests.exceptions.ConnectionError as e:
+                if attempt == self.MAX_RETRIES:
+                    raise
+                self.logger.warning("Falha de conexão com o Notion (%s), tentativa %d de %d", e, attempt + 1, self.MAX_RETRIES)
+            else:
+                if response.status_code not in self.RETRY_STATUS_CODES or attempt == self.MAX_RETRIES:
+                    return response
+                try:
+                    retry_after = float(response.headers.get("Retry-After", 0))
+                except ValueError:
+                    retry_after = 0.0  # Retry-After em formato de data HTTP
+                self.logger.warning("Notion respondeu %d, tentativa %d de %d", response.status_code, attempt + 1, self.MAX_RETRIES)
+            
+            time.sleep(max(retry_after, min(self.MAX_RETRY_DELAY, 2 ** attempt + random.random() * 0.5)))
+    
+    def _throttle_request(self) -> None:
+        """
+        Espaça as requisições entre todas as threads para respeitar o limite da API.
+        """
+        with self._request_lock:
+            wait = self._last_request_time + self.REQUEST_INTERVAL - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            self._last_request_time = time.monotonic()
+    
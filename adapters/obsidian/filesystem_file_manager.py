@@ -1,7 +1,8 @@
 # adapters/obsidian/filesystem_file_manager.py
 import logging
+import os
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Optional, Set
 
 from core.interfaces.obsidian_file_manager import ObsidianFileManager
 from core.exceptions import ObsidianFileError
@@ -27,7 +28,14 @@ class FilesystemFileManager:
             ObsidianFileError: If vault_path is invalid or doesn't exist
         """
         self.vault_path = Path(vault_path)
+        # Per-note paths are built with os.path on this string (cheaper than Path objects)
+        self._vault_str = str(self.vault_path)
         self.logger = logging.getLogger(__name__)
+        # Folders (relative to the vault) already checked or created, so bulk
+        # exports stat each folder once
+        self._known_folders: Set[str] = set()
+        # Snapshot of note filenames per primed folder (see prime_existence_cache)
+        self._existing_notes: Dict[str, Set[str]] = {}
 
         # Validate vault path
         if not self.vault_path.exists():
@@ -61,13 +69,8 @@ class FilesystemFileManager:
             # Ensure folder exists
             self.ensure_folder_exists(folder)
 
-            # Build full path
-            file_path = self.vault_path / folder / filename
-
-            # Write file
-            file_path.write_text(content, encoding='utf-8')
-
-            self.logger.debug(f"Created note: {file_path}")
+            # Build full path and write file
+            self._write_note(folder, filename, content)
             return True
 
         except Exception as e:
@@ -75,6 +78,58 @@ class FilesystemFileManager:
             self.logger.error(error_msg)
             raise ObsidianFileError(error_msg) from e
 
+    def _write_note(self, folder: str, filename: str, content: str) -> None:
+        """
+        Write a note into a folder that has already been ensured.
+
+        Args:
+            folder: Folder path relative to vault root
+            filename: Note filename including .md extension
+            content: Markdown content
+        """
+        file_path = os.path.join(self._vault_str, folder, filename)
+        data = content.encode('utf-8')
+
+        try:
+            self._atomic_write(file_path, data)
+        except FileNotFoundError:
+            # Folder removed since it was cached: create it again and retry once
+            self._known_folders.discard(folder)
+            self.ensure_folder_exists(folder)
+            self._atomic_write(file_path, data)
+
+        existing = self._existing_notes.get(folder)
+        if existing is not None:
+            existing.add(filename)
+
+        self.logger.debug(f"Created note: {file_path}")
+
+    def _atomic_write(self, file_path: str, data: bytes) -> None:
+        """
+        Write a file through a temporary sibling that is renamed into place.
+
+        An interrupted write leaves the previous note (or no note) instead of a
+        truncated one. Permissions follow the umask, as with a plain write.
+        Content is written as already-encoded bytes, bypassing the text I/O layer.
+
+        Args:
+            file_path: Destination file path
+            data: UTF-8 encoded content
+        """
+        # Hidden, so Obsidian ignores it while it is being written
+        directory, name = os.path.split(file_path)
+        tmp_path = os.path.join(directory, f".{name}.tmp")
+        try:
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            try:
+                os.unlink(tmp_path)
+            except OSError:
+                pass
+            raise
+
     def update_note(self, folder: str, filename: str, content: str) -> bool:
         """
         Update an existing note.
@@ -92,16 +147,16 @@ class FilesystemFileManager:
         """
         try:
             # Build full path
-            file_path = self.vault_path / folder / filename
+            file_path = os.path.join(self._vault_str, folder, filename)
 
             # Check if file exists
-            if not file_path.exists():
+            if not os.path.exists(file_path):
                 error_msg = f"Note does not exist: {filename}"
                 self.logger.warning(error_msg)
                 raise ObsidianFileError(error_msg)
 
             # Write file (overwrite)
-            file_path.write_text(content, encoding='utf-8')
+            self._atomic_write(file_path, content.encode('utf-8'))
 
             self.logger.debug(f"Updated note: {file_path}")
             return True
@@ -122,9 +177,12 @@ class FilesystemFileManager:
         Returns:
             True if note exists, False otherwise
         """
+        existing = self._existing_notes.get(folder)
+        if existing is not None:
+            return filename in existing
+
         try:
-            file_path = self.vault_path / folder / filename
-            exists = file_path.exists() and file_path.is_file()
+            exists = os.path.isfile(os.path.join(self._vault_str, folder, filename))
 
             self.logger.debug(f"Note exists check for '{filename}': {exists}")
             return exists
@@ -133,6 +191,28 @@ class FilesystemFileManager:
             self.logger.warning(f"Error checking if note exists: {str(e)}")
             return False
 
+    def prime_existence_cache(self, folders: Iterable[str]) -> None:
+        """
+        Snapshot the notes of the given folders with one directory listing each.
+
+        note_exists then answers from the snapshot for those folders instead of
+        stat'ing every note; notes created through this manager are added to it.
+        Priming again refreshes the snapshot.
+
+        Args:
+            folders: Folder paths relative to vault root
+        """
+        for folder in folders:
+            try:
+                with os.scandir(os.path.join(self._vault_str, folder)) as entries:
+                    self._existing_notes[folder] = {entry.name for entry in entries if entry.is_file()}
+            except FileNotFoundError:
+                self._existing_notes[folder] = set()
+            except OSError as e:
+                # Leave the folder unprimed: note_exists falls back to stat
+                self._existing_notes.pop(folder, None)
+                self.logger.warning(f"Could not list folder '{folder}': {str(e)}")
+
     def get_note_content(self, folder: str, filename: str) -> Optional[str]:
         """
         Get the content of an existing note.
@@ -148,13 +228,15 @@ class FilesystemFileManager:
             ObsidianFileError: If file reading fails
         """
         try:
-            file_path = self.vault_path / folder / filename
+            file_path = os.path.join(self._vault_str, folder, filename)
 
-            if not file_path.exists():
+            try:
+                with open(file_path, 'rb') as f:
+                    content = f.read().decode('utf-8')
+            except FileNotFoundError:
                 self.logger.debug(f"Note not found: {filename}")
                 return None
 
-            content = file_path.read_text(encoding='utf-8')
             self.logger.debug(f"Read note: {filename} ({len(content)} chars)")
             return content
 
@@ -177,6 +259,9 @@ class FilesystemFileManager:
             ObsidianFileError: If folder creation fails
         """
         try:
+            if folder in self._known_folders:
+                return True
+
             folder_path = self.vault_path / folder
 
             if folder_path.exists():
@@ -186,11 +271,13 @@ class FilesystemFileManager:
                     raise ObsidianFileError(error_msg)
 
                 self.logger.debug(f"Folder already exists: {folder}")
+                self._known_folders.add(folder)
                 return True
 
             # Create folder and any parent folders
             folder_path.mkdir(parents=True, exist_ok=True)
             self.logger.info(f"Created folder: {folder}")
+            self._known_folders.add(folder)
             return True
 
         except Exception as e:
@@ -1,6 +1,6 @@
 # adapters/obsidian/mcp_file_manager.py
 import logging
-from typing import Optional
+from typing import Dict, Iterable, Optional
 
 from core.interfaces.obsidian_file_manager import ObsidianFileManager
 from core.exceptions import ObsidianFileError
@@ -20,6 +20,9 @@ class McpFileManager:
     - obsidian-mcp-tools:list_vault_files - List files (for existence check)
     """
 
+    # MCP availability per vault path, checked once per process
+    _mcp_available_cache: Dict[str, bool] = {}
+
     def __init__(self, vault_path: str):
         """
         Initialize the MCP file manager with filesystem fallback.
@@ -30,17 +33,32 @@ class McpFileManager:
         self.vault_path = vault_path
         self.logger = logging.getLogger(__name__)
 
-        # Create filesystem fallback
-        self.fallback = FilesystemFileManager(vault_path)
+        # Filesystem fallback is created on first use (see fallback property)
+        self._fallback: Optional[FilesystemFileManager] = None
 
         # Check if MCP tools are available
-        self.mcp_available = self._check_mcp_availability()
+        mcp_available = self._mcp_available_cache.get(vault_path)
+        if mcp_available is None:
+            mcp_available = self._mcp_available_cache[vault_path] = self._check_mcp_availability()
+        self.mcp_available = mcp_available
 
         if self.mcp_available:
             self.logger.info("MCP tools detected and available")
         else:
             self.logger.warning("MCP tools not available, using filesystem fallback")
 
+    @property
+    def fallback(self) -> FilesystemFileManager:
+        """
+        Filesystem fallback, created (and the vault path validated) on first use.
+
+        Raises:
+            ObsidianFileError: If vault_path is invalid or doesn't exist
+        """
+        if self._fallback is None:
+            self._fallback = FilesystemFileManager(self.vault_path)
+        return self._fallback
+
     def create_note(self, folder: str, filename: str, content: str) -> bool:
         """
         Create a new note using MCP tools or fallback.
@@ -113,6 +131,17 @@ class McpFileManager:
             # If MCP fails, fall back to filesystem check
             return self.fallback.note_exists(folder, filename)
 
+    def prime_existence_cache(self, folders: Iterable[str]) -> None:
+        """
+        Snapshot existing notes so note_exists avoids per-note checks.
+
+        Only the filesystem fallback keeps a snapshot; MCP lookups are not cached.
+
+        Args:
+            folders: Folder paths relative to vault root
+        """
+        self.fallback.prime_existence_cache(folders)
+
     def get_note_content(self, folder: str, filename: str) -> Optional[str]:
         """
         Get note content using MCP tools or fallback.
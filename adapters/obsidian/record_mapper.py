@@ -2,8 +2,7 @@
 import logging
 import re
 from datetime import datetime
-from typing import Dict, Any, List
-from pathlib import Path
+from typing import Dict, Any, List, Sequence
 
 from core.interfaces.obsidian_record_mapper import ObsidianRecordMapper
 from core.domain.obsidian_export_config import ObsidianExportConfig
@@ -20,6 +19,19 @@ class GoogleBooksObsidianRecordMapper:
     4. Config defaults for user-configurable fields
     """
 
+    # Characters invalid in Windows/Unix filenames, as a str.translate deletion table
+    INVALID_FILENAME_CHARS = str.maketrans('', '', ':<>/\\|*?"')
+    # {placeholder} in a filename pattern
+    FILENAME_PLACEHOLDER = re.compile(r'\{([^}]+)\}')
+    TOPIC_SEPARATOR = re.compile(r'[,;]')
+
+    # Fallback chains for fields read from more than one column
+    TITLE_KEYS = ("GB_Titulo", "Titulo_Extraido")
+    AUTHOR_KEYS = ("GB_Autores", "Autor_Extraido")
+    ISBN_KEYS = ("GB_ISBN13", "GB_ISBN10")
+    # Dotted abbreviations that keep a title from being treated as a filename
+    TITLE_ABBREVIATIONS = ("Dr.", "Mr.", "Ph.D")
+
     def __init__(self):
         """Initialize the record mapper."""
         self.logger = logging.getLogger(__name__)
@@ -37,48 +49,48 @@ class GoogleBooksObsidianRecordMapper:
         """
         self.logger.debug(f"Mapping record with {len(record)} fields")
 
-        # Current timestamp for created/updated
-        now = datetime.now()
+        # Current timestamp for created/updated (formatted once, shared by both)
+        now = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
         # Build template data dictionary
         # Get file path first as it's needed for description
-        file_path = self._get_field(record, ["Caminho"], "")
+        file_path = self._get_field(record, ("Caminho",), "")
 
         # Build description with file path appended
-        base_description = self._get_field(record, ["GB_Descricao"], "")
+        base_description = self._get_field(record, ("GB_Descricao",), "")
         description = self._build_description_with_path(base_description, file_path)
 
         data = {
             # Book metadata (with priority fallback)
             "title": self._get_title(record),
             "author": self._get_author(record),
-            "publisher": self._get_field(record, ["GB_Editora"], ""),
-            "publishDate": self._get_field(record, ["GB_Data_Publicacao"], ""),
-            "totalPage": self._get_field(record, ["GB_Paginas"], ""),
-            "isbn10": self._get_field(record, ["GB_ISBN10"], ""),
-            "isbn13": self._get_field(record, ["GB_ISBN13"], ""),
-            "coverUrl": self._get_field(record, ["GB_Capa_Link"], ""),
+            "publisher": self._get_field(record, ("GB_Editora",), ""),
+            "publishDate": self._get_field(record, ("GB_Data_Publicacao",), ""),
+            "totalPage": self._get_field(record, ("GB_Paginas",), ""),
+            "isbn10": self._get_field(record, ("GB_ISBN10",), ""),
+            "isbn13": self._get_field(record, ("GB_ISBN13",), ""),
+            "coverUrl": self._get_field(record, ("GB_Capa_Link",), ""),
             "description": description,
-            "categories": self._get_field(record, ["GB_Categorias"], ""),
-            "topics": self._format_topics_list(self._get_topics(record)),
-            "language": self._get_field(record, ["GB_Idioma"], ""),
-            "preview_link": self._get_field(record, ["GB_Preview_Link"], ""),
+            "categories": self._get_field(record, ("GB_Categorias",), ""),
+            "topics": self._format_yaml_list(self._get_topics(record)),
+            "language": self._get_field(record, ("GB_Idioma",), ""),
+            "preview_link": self._get_field(record, ("GB_Preview_Link",), ""),
 
             # File metadata
             "format": self._get_format(record),
-            "file_size": self._get_field(record, ["Tamanho(MB)"], ""),
+            "file_size": self._get_field(record, ("Tamanho(MB)",), ""),
             "file_path": file_path,
-            "modified_date": self._get_field(record, ["Data Modificação"], ""),
+            "modified_date": self._get_field(record, ("Data Modificação",), ""),
 
             # Date fields (current timestamp)
-            "created": now.strftime("%Y-%m-%d %H:%M:%S"),
-            "updated": now.strftime("%Y-%m-%d %H:%M:%S"),
+            "created": now,
+            "updated": now,
 
             # User-configurable defaults from config
             "status": config.default_status,
             "priority": config.default_priority,
             "device": config.default_device,
-            "purpose": self._format_purpose_list(config.default_purpose),
+            "purpose": self._format_yaml_list(config.default_purpose),
         }
 
         self.logger.debug(f"Mapped to {len(data)} template fields")
@@ -101,14 +113,10 @@ class GoogleBooksObsidianRecordMapper:
             filename = filename[:-3]
 
         # Remove invalid characters for Windows/Unix filesystems
-        invalid_chars = r'[:<>/\\|*?""]'
-        sanitized = re.sub(invalid_chars, '', filename)
+        sanitized = filename.translate(self.INVALID_FILENAME_CHARS)
 
-        # Collapse multiple spaces to single space
-        sanitized = re.sub(r'\s+', ' ', sanitized)
-
-        # Strip leading/trailing whitespace
-        sanitized = sanitized.strip()
+        # Collapse whitespace runs to single spaces and strip the ends
+        sanitized = ' '.join(sanitized.split())
 
         # If empty after sanitization, use default
         if not sanitized:
@@ -141,21 +149,17 @@ class GoogleBooksObsidianRecordMapper:
         placeholders = {
             "title": self._get_title(record),
             "author": self._get_author(record),
-            "publisher": self._get_field(record, ["GB_Editora"], "Unknown"),
-            "isbn": self._get_field(record, ["GB_ISBN13", "GB_ISBN10"], ""),
+            "publisher": self._get_field(record, ("GB_Editora",), "Unknown"),
+            "isbn": self._get_field(record, self.ISBN_KEYS, ""),
             "format": self._get_format(record),
         }
 
-        # Replace placeholders in pattern
-        filename = pattern
-        for key, value in placeholders.items():
-            placeholder = f"{{{key}}}"
-            if placeholder in filename:
-                # Use value or empty if not available
-                filename = filename.replace(placeholder, str(value) if value else "")
+        # Replace placeholders in a single pass; unknown ones and missing values become empty
+        def replace_placeholder(match):
+            value = placeholders.get(match.group(1))
+            return str(value) if value else ""
 
-        # Remove any remaining unreplaced placeholders
-        filename = re.sub(r'\{[^}]+\}', '', filename)
+        filename = self.FILENAME_PLACEHOLDER.sub(replace_placeholder, pattern)
 
         # Sanitize the result
         sanitized = self.sanitize_filename(filename, max_length)
@@ -165,22 +169,24 @@ class GoogleBooksObsidianRecordMapper:
 
     def _get_title(self, record: Dict[str, Any]) -> str:
         """Get book title with priority fallback."""
-        title = self._get_field(record, ["GB_Titulo", "Titulo_Extraido"], "")
+        title = self._get_field(record, self.TITLE_KEYS, "")
 
         # If no title, use filename without extension
         if not title:
             nome = record.get("Nome", "Untitled")
-            title = Path(nome).stem  # Remove extension
+            # Remove extension (same rule as Path.stem, without building a Path)
+            dot = nome.rfind('.')
+            title = nome[:dot] if 0 < dot < len(nome) - 1 else nome
 
         # Clean up title if it looks like a filename
-        if '.' in title and not any(word in title for word in ["Dr.", "Mr.", "Ph.D"]):
+        if '.' in title and not any(word in title for word in self.TITLE_ABBREVIATIONS):
             title = title.split('.')[0]
 
         return title.strip()
 
     def _get_author(self, record: Dict[str, Any]) -> str:
         """Get book author with priority fallback."""
-        author = self._get_field(record, ["GB_Autores", "Autor_Extraido"], "Unknown Author")
+        author = self._get_field(record, self.AUTHOR_KEYS, "Unknown Author")
         return author.strip()
 
     def _get_format(self, record: Dict[str, Any]) -> str:
@@ -188,18 +194,25 @@ class GoogleBooksObsidianRecordMapper:
         format_value = record.get("Formato", "unknown")
         return format_value.lower() if format_value else "unknown"
 
-    def _get_field(self, record: Dict[str, Any], keys: list, default: Any = "") -> Any:
+    def _get_field(self, record: Dict[str, Any], keys: Sequence[str], default: Any = "") -> Any:
         """
-        Get first non-empty value from list of keys.
+        Get first non-empty value from a sequence of keys.
 
         Args:
             record: Data record
-            keys: List of keys to try in order
+            keys: Keys to try in order
             default: Default value if all keys are empty
 
         Returns:
             First non-empty value or default
         """
+        # Fast path: most fields come from a single column
+        if len(keys) == 1:
+            value = record.get(keys[0])
+            if isinstance(value, str):
+                return value.strip() or default
+            return value if value else default
+
         for key in keys:
             if key in record and record[key]:
                 value = record[key]
@@ -213,21 +226,20 @@ class GoogleBooksObsidianRecordMapper:
 
         return default
 
-    def _format_purpose_list(self, purpose_list: list) -> str:
+    def _format_yaml_list(self, items: List[str]) -> str:
         """
-        Format purpose list for template (comma-separated or as list).
+        Format a list of tags/topics as an inline YAML list.
 
         Args:
-            purpose_list: List of purpose tags
+            items: List of strings
 
         Returns:
-            Formatted string
+            Formatted string like [item1, item2, item3]
         """
-        if not purpose_list:
+        if not items:
             return "[]"
 
-        # Return as list format for YAML: [item1, item2]
-        return "[" + ", ".join(purpose_list) + "]"
+        return f"[{', '.join(items)}]"
 
     def _get_topics(self, record: Dict[str, Any]) -> List[str]:
         """
@@ -240,22 +252,15 @@ class GoogleBooksObsidianRecordMapper:
             record: CSV record data
 
         Returns:
-            List of unique topic strings
+            List of unique topic strings, in order of first appearance
         """
-        topics = []
-
-        # Try Temas_Sugeridos first
-        if "Temas_Sugeridos" in record and record["Temas_Sugeridos"]:
-            topics_str = record["Temas_Sugeridos"]
-            topics.extend(self._split_topics(topics_str))
+        # Try Temas_Sugeridos first, then GB_Categorias
+        topics_str = record.get("Temas_Sugeridos") or record.get("GB_Categorias")
+        if not topics_str:
+            return []
 
-        # Then try GB_Categorias
-        elif "GB_Categorias" in record and record["GB_Categorias"]:
-            topics_str = record["GB_Categorias"]
-            topics.extend(self._split_topics(topics_str))
-
-        # Deduplicate and return
-        return list(set(topics))
+        # Deduplicate keeping first-seen order so generated notes are stable
+        return list(dict.fromkeys(self._split_topics(topics_str)))
 
     def _split_topics(self, topics_str: str) -> List[str]:
         """
@@ -268,28 +273,12 @@ class GoogleBooksObsidianRecordMapper:
             List of cleaned topic strings
         """
         topics = []
-        for topic in re.split(r'[,;]', topics_str):
+        for topic in self.TOPIC_SEPARATOR.split(topics_str):
             topic = topic.strip()
             if topic:
                 topics.append(topic)
         return topics
 
-    def _format_topics_list(self, topics: List[str]) -> str:
-        """
-        Format topics list for YAML frontmatter.
-
-        Args:
-            topics: List of topic strings
-
-        Returns:
-            Formatted string like [topic1, topic2, topic3]
-        """
-        if not topics:
-            return "[]"
-
-        # Return as list format for YAML: [item1, item2]
-        return "[" + ", ".join(topics) + "]"
-
     def _build_description_with_path(self, description: str, file_path: str) -> str:
         """
         Build description with file path appended at the end.
@@ -18,6 +18,16 @@ class MarkdownTemplateEngine:
     supports date formatting, and handles missing placeholders gracefully.
     """
 
+    # {{DATE:format}} placeholders, resolved before Jinja2 rendering
+    DATE_PLACEHOLDER_PATTERN = re.compile(r'\{\{DATE:([^}]+)\}\}')
+    # DATE format tokens and their strftime equivalents, replaced in one pass
+    DATE_TOKENS = {'YYYY': '%Y', 'MM': '%m', 'DD': '%d', 'HH': '%H', 'mm': '%M', 'ss': '%S'}
+    DATE_TOKEN_PATTERN = re.compile('|'.join(map(re.escape, DATE_TOKENS)))
+    # Render variable holding the moment DATE placeholders are formatted with
+    DATE_VARIABLE = '__render_time__'
+    # Placeholder contents, for the regex fallback of get_placeholders
+    PLACEHOLDER_PATTERN = re.compile(r'\{\{([^}]+)\}\}')
+
     def __init__(self):
         """Initialize the template engine."""
         self.logger = logging.getLogger(__name__)
@@ -34,6 +44,11 @@ class MarkdownTemplateEngine:
         # Register custom filters
         self.env.filters['date_format'] = self._date_format_filter
 
+        # Compiled templates by source: an export renders the same template for every book
+        self._template_cache: Dict[str, Template] = {}
+        # Placeholder names by source, so repeated probes skip the Jinja2 parse
+        self._placeholder_cache: Dict[str, Tuple[str, ...]] = {}
+
     def render(self, template: str, data: Dict[str, Any]) -> str:
         """
         Render a template with provided data.
@@ -49,17 +64,13 @@ class MarkdownTemplateEngine:
             ObsidianTemplateError: If template rendering fails
         """
         try:
-            # Pre-process template to handle DATE placeholders
-            template = self._preprocess_date_placeholders(template)
-
-            # Create Jinja2 template
-            jinja_template = self.env.from_string(template)
-
-            # Render with data, using empty string for undefined variables
-            rendered = jinja_template.render(**data)
+            # Create (or reuse) the Jinja2 template, DATE placeholders included
+            jinja_template = self._compile(template)
 
-            # Post-process to clean up any remaining undefined placeholders
-            rendered = self._clean_undefined_placeholders(rendered)
+            # Render with data; Jinja2's default Undefined already renders missing
+            # variables as empty strings, so no post-pass over the output is needed.
+            # All DATE placeholders share one timestamp
+            rendered = jinja_template.render(**data, **{self.DATE_VARIABLE: datetime.now()})
 
             self.logger.debug(f"Template rendered successfully ({len(rendered)} chars)")
             return rendered
@@ -110,6 +121,21 @@ class MarkdownTemplateEngine:
         Returns:
             List of placeholder names (without {{ }})
         """
+        placeholders = self._placeholder_cache.get(template)
+        if placeholders is None:
+            placeholders = self._placeholder_cache[template] = tuple(self._parse_placeholders(template))
+        return list(placeholders)
+
+    def _parse_placeholders(self, template: str) -> List[str]:
+        """
+        Parse a template and extract its placeholder names.
+
+        Args:
+            template: Template string
+
+        Returns:
+            List of placeholder names
+        """
         try:
             # Parse template to get AST
             ast = self.env.parse(template)
@@ -124,47 +150,51 @@ class MarkdownTemplateEngine:
             # Fallback to regex extraction
             return self._extract_placeholders_regex(template)
 
+    def _compile(self, template: str) -> Template:
+        """
+        Get the compiled Jinja2 template for a template source, compiling it once.
+
+        Args:
+            template: Original template string
+
+        Returns:
+            Compiled template
+
+        Raises:
+            TemplateSyntaxError: If the template is invalid
+        """
+        jinja_template = self._template_cache.get(template)
+        if jinja_template is None:
+            # Pre-process template to handle DATE placeholders
+            processed = self._preprocess_date_placeholders(template)
+            jinja_template = self._template_cache[template] = self.env.from_string(processed)
+        return jinja_template
+
     def _preprocess_date_placeholders(self, template: str) -> str:
         """
         Convert {{DATE:format}} placeholders to Jinja2 date filter syntax.
 
+        The date itself is supplied at render time (DATE_VARIABLE), so the
+        processed template does not depend on the current time and can be cached.
+
         Args:
             template: Original template string
 
         Returns:
             Template with processed date placeholders
         """
-        # Pattern to match {{DATE:format}}
-        date_pattern = r'\{\{DATE:([^}]+)\}\}'
-
         def replace_date(match):
             format_str = match.group(1)
             # Convert common format tokens to Python strftime format
             # YYYY -> %Y, MM -> %m, DD -> %d, HH -> %H, mm -> %M, ss -> %S
-            python_format = format_str.replace('YYYY', '%Y').replace('MM', '%m').replace('DD', '%d')
-            python_format = python_format.replace('HH', '%H').replace('mm', '%M').replace('ss', '%S')
+            python_format = self.DATE_TOKEN_PATTERN.sub(lambda token: self.DATE_TOKENS[token.group(0)], format_str)
 
-            # Convert to current datetime with format
-            current_date = datetime.now().strftime(python_format)
-            return current_date
+            # Format the render time with the date_format filter
+            return f"{{{{ {self.DATE_VARIABLE}|date_format({python_format!r}) }}}}"
 
-        processed = re.sub(date_pattern, replace_date, template)
+        processed = self.DATE_PLACEHOLDER_PATTERN.sub(replace_date, template)
         return processed
 
-    def _clean_undefined_placeholders(self, rendered: str) -> str:
-        """
-        Clean up any remaining undefined placeholders (show as empty).
-
-        Args:
-            rendered: Rendered template string
-
-        Returns:
-            Cleaned string with undefined placeholders removed
-        """
-        # Remove any remaining {{ }} that weren't replaced
-        cleaned = re.sub(r'\{\{[^}]*\}\}', '', rendered)
-        return cleaned
-
     def _extract_placeholders_regex(self, template: str) -> List[str]:
         """
         Extract placeholders using regex (fallback method).
@@ -175,8 +205,7 @@ class MarkdownTemplateEngine:
         Returns:
             List of placeholder names
         """
-        pattern = r'\{\{([^}]+)\}\}'
-        matches = re.findall(pattern, template)
+        matches = self.PLACEHOLDER_PATTERN.findall(template)
 
         # Clean up placeholder names (remove spaces, filters, etc.)
         placeholders = []
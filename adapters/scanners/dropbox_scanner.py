@@ -1,23 +1,15 @@
 import logging
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-from pathlib import Path
+from typing import Dict, Any, Optional, Iterator, Tuple
 import dropbox
-from core.interfaces.scanner import Scanner
+from adapters.scanners.ebook_file_scanner import EbookFileScanner
 
-class DropboxScanner(Scanner):
+class DropboxScanner(EbookFileScanner):
     """Scanner para fonte no Dropbox."""
     
-    FORMATOS_EBOOK = {
-        '.epub': 'EPUB',
-        '.pdf': 'PDF',
-        '.mobi': 'MOBI',
-        '.azw': 'AZW',
-        '.azw3': 'AZW3',
-        '.kfx': 'KFX',
-        '.txt': 'TXT'
-    }
+    # Tamanho máximo de página aceito por files_list_folder
+    LIST_FOLDER_LIMIT = 2000
     
     def __init__(self):
         """Inicializa o scanner de Dropbox."""
@@ -50,87 +42,57 @@ class DropboxScanner(Scanner):
             # Escanear pasta
             ebooks = self._scan_folder(dbx, path)
             
-            # Gerar relatório CSV
+            # Gerar relatório CSV à medida que as páginas chegam
             csv_name = f"ebooks_dropbox_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             csv_path = os.path.join(os.getcwd(), csv_name)
             
-            self._save_csv_report(ebooks, csv_path)
+            total = self._save_csv_report(ebooks, csv_path)
             
-            self.logger.info(f"Relatório salvo em {csv_path}: {len(ebooks)} ebooks encontrados")
+            self.logger.info(f"Relatório salvo em {csv_path}: {total} ebooks encontrados")
             return csv_path
             
         except Exception as e:
             self.logger.error(f"Erro ao escanear pasta no Dropbox: {str(e)}")
             return None
     
-    def _is_ebook(self, nome_arquivo: str) -> bool:
-        """Verifica se um arquivo é um ebook baseado na extensão."""
-        extensao = Path(nome_arquivo).suffix.lower()
-        return extensao in self.FORMATOS_EBOOK
-    
-    def _get_formato(self, nome_arquivo: str) -> str:
-        """Obtém o formato do ebook baseado na extensão."""
-        extensao = Path(nome_arquivo).suffix.lower()
-        return self.FORMATOS_EBOOK.get(extensao, 'Desconhecido')
-    
-    def _scan_folder(self, dbx: dropbox.Dropbox, folder_path: str) -> List[Dict[str, Any]]:
+    def _scan_folder(self, dbx: dropbox.Dropbox, folder_path: str) -> Iterator[Tuple[Any, ...]]:
         """
-        Escaneia uma pasta no Dropbox em busca de ebooks.
+        Escaneia uma pasta no Dropbox e suas subpastas em busca de ebooks.
         
         Args:
             dbx: Cliente do Dropbox
             folder_path: Caminho para a pasta
             
-        Returns:
-            Lista de dicionários com informações dos ebooks
+        Yields:
+            Uma linha do relatório por ebook, na ordem de CSV_COLUMNS; as linhas
+            são geradas página a página, sem acumular a pasta inteira
         """
-        ebooks = []
+        classify = self._classify
+        mb_factor = self.MB_FACTOR
         
         try:
-            result = dbx.files_list_folder(folder_path)
+            # A recursão é feita pelo servidor, em páginas de até LIST_FOLDER_LIMIT entradas
+            result = dbx.files_list_folder(folder_path, recursive=True, limit=self.LIST_FOLDER_LIMIT)
             
-            # Processar resultados
-            has_more = True
-            while has_more:
+            while True:
                 for entry in result.entries:
-                    if isinstance(entry, dropbox.files.FileMetadata):
-                        filename = entry.name
-                        if self._is_ebook(filename):
-                            ebook = {
-                                'Nome': filename,
-                                'Formato': self._get_formato(filename),
-                                'Tamanho(MB)': round(entry.size / (1024 * 1024), 2),
-                                'Data Modificação': entry.server_modified.strftime('%Y-%m-%d %H:%M:%S'),
-                                'Caminho': f"dropbox://{folder_path}/{filename}"
-                            }
-                            ebooks.append(ebook)
-                            self.logger.info(f"Ebook encontrado: {filename}")
+                    if not isinstance(entry, dropbox.files.FileMetadata):
+                        continue
+                    formato = classify(entry.name)
+                    if formato is not None:
+                        yield (
+                            entry.name,
+                            formato,
+                            round(entry.size * mb_factor, 2),
+                            self._format_date(entry.server_modified),
+                            f"dropbox://{entry.path_display}"
+                        )
                 
                 # Verificar se há mais resultados
-                if result.has_more:
-                    result = dbx.files_list_folder_continue(result.cursor)
-                else:
-                    has_more = False
+                if not result.has_more:
+                    break
+                result = dbx.files_list_folder_continue(result.cursor)
                     
         except dropbox.exceptions.ApiError as e:
             self.logger.error(f"Erro na API do Dropbox: {str(e)}")
             raise
-        
-        return ebooks
-    
-    def _save_csv_report(self, ebooks: List[Dict[str, Any]], csv_path: str) -> None:
-        """
-        Salva os dados dos ebooks em um arquivo CSV.
-        
-        Args:
-            ebooks: Lista de dicionários com informações dos ebooks
-            csv_path: Caminho para salvar o arquivo CSV
-        """
-        import pandas as pd
-        
-        try:
-            df = pd.DataFrame(ebooks)
-            df.to_csv(csv_path, index=False, encoding='utf-8')
-        except Exception as e:
-            self.logger.error(f"Erro ao salvar relatório CSV: {str(e)}")
-            raise
\ No newline at end of file
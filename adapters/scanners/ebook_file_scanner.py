@@ -0,0 +1,77 @@
+import csv
+import os
+from datetime import datetime
+from typing import Any, Iterable, Optional, Tuple
+from core.interfaces.scanner import Scanner
+
+class EbookFileScanner(Scanner):
+    """
+    Base dos scanners que listam arquivos de ebook (sistema de arquivos, Dropbox, iCloud).
+
+    Reúne a classificação pela extensão e a escrita do relatório CSV no formato
+    padrão do eBook Manager. As subclasses definem self.logger e geram as
+    linhas na ordem de CSV_COLUMNS.
+    """
+
+    FORMATOS_EBOOK = {
+        '.epub': 'EPUB',
+        '.pdf': 'PDF',
+        '.mobi': 'MOBI',
+        '.azw': 'AZW',
+        '.azw3': 'AZW3',
+        '.kfx': 'KFX',
+        '.txt': 'TXT'
+    }
+
+    # Colunas do relatório CSV, na ordem em que são escritas
+    CSV_COLUMNS = ['Nome', 'Formato', 'Tamanho(MB)', 'Data Modificação', 'Caminho']
+    # Bytes -> MB (multiplicar pelo inverso é exato, 2**-20)
+    MB_FACTOR = 1.0 / (1024 * 1024)
+
+    def _classify(self, nome_arquivo: str) -> Optional[str]:
+        """
+        Obtém o formato do ebook a partir da extensão do arquivo.
+
+        Args:
+            nome_arquivo: Nome do arquivo
+
+        Returns:
+            Formato do ebook (ex.: 'EPUB') ou None se o arquivo não for um ebook
+        """
+        # rfind evita criar um Path por arquivo; i > 0 ignora arquivos ocultos como '.epub'
+        i = nome_arquivo.rfind('.')
+        if i <= 0:
+            return None
+        return self.FORMATOS_EBOOK.get(nome_arquivo[i:].lower())
+
+    def _format_date(self, value: datetime) -> str:
+        """Formata a data de modificação como '%Y-%m-%d %H:%M:%S', sem interpretar um formato."""
+        return value.isoformat(sep=' ', timespec='seconds')
+
+    def _save_csv_report(self, ebooks: Iterable[Tuple[Any, ...]], csv_path: str) -> int:
+        """
+        Salva os dados dos ebooks em um arquivo CSV, linha a linha.
+
+        Args:
+            ebooks: Linhas dos ebooks, na ordem de CSV_COLUMNS
+            csv_path: Caminho para salvar o arquivo CSV
+
+        Returns:
+            Número de ebooks gravados
+        """
+        total = 0
+        try:
+            with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.CSV_COLUMNS)
+                for row in ebooks:
+                    writer.writerow(row)
+                    total += 1
+        except Exception as e:
+            self.logger.error(f"Erro ao salvar relatório CSV: {str(e)}")
+            # Não deixar um relatório pela metade para trás
+            if os.path.exists(csv_path):
+                os.remove(csv_path)
+            raise
+
+        return total
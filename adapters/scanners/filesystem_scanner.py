@@ -1,23 +1,14 @@
 import logging
 import os
+import stat
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, Any, Optional, List
-from pathlib import Path
-from core.interfaces.scanner import Scanner
+from typing import Dict, Any, Optional, Iterator, Tuple
+from adapters.scanners.ebook_file_scanner import EbookFileScanner
 
-class FileSystemScanner(Scanner):
+class FileSystemScanner(EbookFileScanner):
     """Scanner para fonte no sistema de arquivos local."""
     
-    FORMATOS_EBOOK = {
-        '.epub': 'EPUB',
-        '.pdf': 'PDF',
-        '.mobi': 'MOBI',
-        '.azw': 'AZW',
-        '.azw3': 'AZW3',
-        '.kfx': 'KFX',
-        '.txt': 'TXT'
-    }
-    
     def __init__(self):
         """Inicializa o scanner de sistema de arquivos."""
         self.logger = logging.getLogger(__name__)
@@ -28,7 +19,8 @@ class FileSystemScanner(Scanner):
         
         Args:
             path: Caminho para a pasta
-            config: Configurações adicionais (não utilizado)
+            config: Configurações adicionais (opcional 'scan_workers': threads
+                para o stat dos arquivos, útil em pastas de rede; padrão 1)
             source_id: ID da fonte (não utilizado)
             
         Returns:
@@ -42,74 +34,102 @@ class FileSystemScanner(Scanner):
         
         try:
             # Escanear pasta
-            ebooks = self._scan_folder(path)
+            scan_workers = int((config or {}).get('scan_workers', 1) or 1)
+            ebooks = self._scan_folder(path, scan_workers)
             
-            # Gerar relatório CSV
+            # Gerar relatório CSV à medida que os ebooks são encontrados
             csv_name = f"ebooks_filesystem_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             csv_path = os.path.join(os.getcwd(), csv_name)
             
-            self._save_csv_report(ebooks, csv_path)
+            total = self._save_csv_report(ebooks, csv_path)
             
-            self.logger.info(f"Relatório salvo em {csv_path}: {len(ebooks)} ebooks encontrados")
+            self.logger.info(f"Relatório salvo em {csv_path}: {total} ebooks encontrados")
             return csv_path
             
         except Exception as e:
             self.logger.error(f"Erro ao escanear pasta no sistema de arquivos: {str(e)}")
             return None
     
-    def _is_ebook(self, nome_arquivo: str) -> bool:
-        """Verifica se um arquivo é um ebook baseado na extensão."""
-        extensao = Path(nome_arquivo).suffix.lower()
-        return extensao in self.FORMATOS_EBOOK
-    
-    def _get_formato(self, nome_arquivo: str) -> str:
-        """Obtém o formato do ebook baseado na extensão."""
-        extensao = Path(nome_arquivo).suffix.lower()
-        return self.FORMATOS_EBOOK.get(extensao, 'Desconhecido')
-    
-    def _scan_folder(self, folder_path: str) -> List[Dict[str, Any]]:
+    def _scan_folder(self, folder_path: str, scan_workers: int = 1) -> Iterator[Tuple[Any, ...]]:
         """
         Escaneia uma pasta e suas subpastas em busca de ebooks.
         
+        Percorre a árvore com os.scandir usando uma pilha, reaproveitando o
+        stat do DirEntry em vez de chamar os.stat novamente para cada arquivo.
+        Com scan_workers > 1, a listagem só coleta os caminhos e o stat de cada
+        arquivo é feito em paralelo (vale a pena em SMB/NFS, onde a latência
+        do stat domina).
+        
         Args:
             folder_path: Caminho para a pasta
+            scan_workers: Número de threads para o stat dos arquivos
             
-        Returns:
-            Lista de dicionários com informações dos ebooks
+        Yields:
+            Uma linha do relatório por ebook, na ordem de CSV_COLUMNS; nada é
+            acumulado, então a memória não cresce com o tamanho da biblioteca
         """
-        ebooks = []
+        candidatos = []
+        paralelo = scan_workers > 1
+        pendentes = [folder_path]
         
-        for root, _, files in os.walk(folder_path):
-            for filename in files:
-                if self._is_ebook(filename):
-                    file_path = os.path.join(root, filename)
-                    file_stat = os.stat(file_path)
-                    
-                    ebook = {
-                        'Nome': filename,
-                        'Formato': self._get_formato(filename),
-                        'Tamanho(MB)': round(file_stat.st_size / (1024 * 1024), 2),
-                        'Data Modificação': datetime.fromtimestamp(file_stat.st_mtime).strftime('%Y-%m-%d %H:%M:%S'),
-                        'Caminho': file_path
-                    }
-                    ebooks.append(ebook)
-                    self.logger.info(f"Ebook encontrado: {filename}")
+        while pendentes:
+            pasta = pendentes.pop()
+            try:
+                with os.scandir(pasta) as entradas:
+                    for entry in entradas:
+                        # Mesmo comportamento do os.walk: não segue links para pastas
+                        if entry.is_dir(follow_symlinks=False):
+                            pendentes.append(entry.path)
+                            continue
+                        
+                        formato = self._classify(entry.name)
+                        if formato is None:
+                            continue
+                        
+                        if paralelo:
+                            candidatos.append((entry.name, formato, entry.path))
+                            continue
+                        
+                        if not entry.is_file():
+                            continue
+                        
+                        yield self._ebook_row(entry.name, formato, entry.path, entry.stat())
+            except OSError as e:
+                # os.walk também ignora pastas que não podem ser listadas
+                self.logger.warning(f"Não foi possível ler a pasta {pasta}: {str(e)}")
         
-        return ebooks
+        if candidatos:
+            with ThreadPoolExecutor(max_workers=scan_workers) as executor:
+                stats = executor.map(self._stat_one, [file_path for _, _, file_path in candidatos])
+                for (nome, formato, file_path), file_stat in zip(candidatos, stats):
+                    if file_stat is not None:
+                        yield self._ebook_row(nome, formato, file_path, file_stat)
     
-    def _save_csv_report(self, ebooks: List[Dict[str, Any]], csv_path: str) -> None:
+    def _stat_one(self, file_path: str) -> Optional[os.stat_result]:
         """
-        Salva os dados dos ebooks em um arquivo CSV.
+        Obtém o stat de um ebook a partir do seu caminho.
         
         Args:
-            ebooks: Lista de dicionários com informações dos ebooks
-            csv_path: Caminho para salvar o arquivo CSV
+            file_path: Caminho do arquivo
+            
+        Returns:
+            Resultado do os.stat ou None se não for um arquivo legível
         """
-        import pandas as pd
-        
         try:
-            df = pd.DataFrame(ebooks)
-            df.to_csv(csv_path, index=False, encoding='utf-8')
-        except Exception as e:
-            self.logger.error(f"Erro ao salvar relatório CSV: {str(e)}")
-            raise
\ No newline at end of file
+            file_stat = os.stat(file_path)
+        except OSError as e:
+            self.logger.warning(f"Não foi possível ler {file_path}: {str(e)}")
+            return None
+        
+        return file_stat if stat.S_ISREG(file_stat.st_mode) else None
+    
+    def _ebook_row(self, nome: str, formato: str, file_path: str, file_stat: os.stat_result) -> Tuple[Any, ...]:
+        """Monta a linha do relatório para um ebook, na ordem de CSV_COLUMNS."""
+        self.logger.debug("Ebook encontrado: %s", nome)
+        return (
+            nome,
+            formato,
+            round(file_stat.st_size * self.MB_FACTOR, 2),
+            self._format_date(datetime.fromtimestamp(file_stat.st_mtime)),
+            file_path
+        )
@@ -1,26 +1,19 @@
 import logging
 import os
 from datetime import datetime
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, Iterator, Tuple
 from pyicloud import PyiCloudService
 from pyicloud.exceptions import PyiCloudFailedLoginException, PyiCloudException
-from core.interfaces.scanner import Scanner
+from adapters.scanners.ebook_file_scanner import EbookFileScanner
 from core.services.credential_service import CredentialService
 
 logger = logging.getLogger(__name__)
 
-class ICloudScanner(Scanner):
+class ICloudScanner(EbookFileScanner):
     """Scanner para fonte iCloud com gerenciamento seguro de credenciais."""
     
-    FORMATOS_EBOOK = {
-        '.epub': 'EPUB',
-        '.pdf': 'PDF',
-        '.mobi': 'MOBI',
-        '.azw': 'AZW',
-        '.azw3': 'AZW3',
-        '.kfx': 'KFX',
-        '.txt': 'TXT'
-    }
+    # Onde o pyicloud guarda cookies e o token de sessão entre execuções
+    SESSION_DIRECTORY = os.path.join('~', '.cache', 'ebook_manager', 'icloud')
     
     def __init__(self, credential_service: CredentialService):
         """
@@ -54,8 +47,8 @@ class ICloudScanner(Scanner):
             return None
         
         try:
-            # Conectar ao iCloud
-            api = PyiCloudService(username, password)
+            # Conectar ao iCloud (reaproveita a sessão salva, se ainda for válida)
+            api = self._connect(username, password)
             
             if api.requires_2fa:
                 self.logger.info("Autenticação de dois fatores necessária.")
@@ -75,13 +68,13 @@ class ICloudScanner(Scanner):
             # Escanear pasta
             ebooks = self._scan_pasta(api, path)
             
-            # Gerar relatório CSV
+            # Gerar relatório CSV à medida que os ebooks são encontrados
             csv_name = f"ebooks_icloud_{datetime.now().strftime('%Y%m%d_%H%M%S')}.csv"
             csv_path = os.path.join(os.getcwd(), csv_name)
             
-            self._save_csv_report(ebooks, csv_path)
+            total = self._save_csv_report(ebooks, csv_path)
             
-            self.logger.info(f"Relatório salvo em {csv_path}: {len(ebooks)} ebooks encontrados")
+            self.logger.info(f"Relatório salvo em {csv_path}: {total} ebooks encontrados")
             return csv_path
             
         except Exception as e:
@@ -118,19 +111,27 @@ class ICloudScanner(Scanner):
         
         return username, password
     
-    def _is_ebook(self, nome_arquivo: str) -> bool:
-        """Verifica se um arquivo é um ebook baseado na extensão."""
-        from pathlib import Path
-        extensao = Path(nome_arquivo).suffix.lower()
-        return extensao in self.FORMATOS_EBOOK
-    
-    def _get_formato(self, nome_arquivo: str) -> str:
-        """Obtém o formato do ebook baseado na extensão."""
-        from pathlib import Path
-        extensao = Path(nome_arquivo).suffix.lower()
-        return self.FORMATOS_EBOOK.get(extensao, 'Desconhecido')
+    def _connect(self, username: str, password: str) -> PyiCloudService:
+        """
+        Cria a conexão com o iCloud usando um diretório de sessão persistente.
+        
+        Com o token salvo, o pyicloud só valida a sessão em vez de refazer o
+        login completo, e a confiança do 2FA sobrevive entre execuções (o
+        diretório padrão do pyicloud fica no temporário do sistema).
+        
+        Args:
+            username: Apple ID
+            password: Senha
+            
+        Returns:
+            Instância autenticada da API do iCloud
+        """
+        session_directory = os.path.expanduser(self.SESSION_DIRECTORY)
+        # O pyicloud só cria o último nível do diretório
+        os.makedirs(session_directory, mode=0o700, exist_ok=True)
+        return PyiCloudService(username, password, cookie_directory=session_directory)
     
-    def _scan_pasta(self, api, caminho_pasta: str) -> List[Dict[str, Any]]:
+    def _scan_pasta(self, api, caminho_pasta: str) -> Iterator[Tuple[Any, ...]]:
         """
         Escaneia uma pasta no iCloud Drive em busca de ebooks.
         
@@ -138,10 +139,9 @@ class ICloudScanner(Scanner):
             api: Instância autenticada da API do iCloud
             caminho_pasta: Caminho para a pasta no iCloud Drive
             
-        Returns:
-            Lista de dicionários com informações dos ebooks
+        Yields:
+            Uma linha do relatório por ebook, na ordem de CSV_COLUMNS
         """
-        ebooks = []
         self.logger.info(f"Escaneando pasta iCloud Drive: {caminho_pasta}")
         
         try:
@@ -155,41 +155,23 @@ class ICloudScanner(Scanner):
                     pasta = pasta[parte]
                     self.logger.info(f"Navegando para: {parte}")
             
-            for item_str in pasta.dir():
-                item = pasta[item_str]
-                if self._is_ebook(item.name):
-                    ebook = {
-                        'Nome': item.name,
-                        'Formato': self._get_formato(item.name),
-                        'Tamanho(MB)': round(item.size / (1024 * 1024), 2),
-                        'Data Modificação': item.date_modified.strftime('%Y-%m-%d %H:%M:%S'),
-                        'Caminho': f"{caminho_pasta}/{item.name}"
-                    }
-                    ebooks.append(ebook)
+            # Os filhos (com nome, tamanho e data) vêm de uma única requisição;
+            # percorrê-los direto evita a busca linear de pasta[nome] para cada item
+            for item in pasta.get_children():
+                formato = self._classify(item.name)
+                if formato is not None:
                     self.logger.info(f"Ebook encontrado: {item.name}")
+                    yield (
+                        item.name,
+                        formato,
+                        round(item.size * self.MB_FACTOR, 2),
+                        item.date_modified.strftime('%Y-%m-%d %H:%M:%S'),
+                        f"{caminho_pasta}/{item.name}"
+                    )
         
         except Exception as e:
             self.logger.error(f"Erro ao escanear pasta {caminho_pasta}: {str(e)}")
             raise
-        
-        return ebooks
-    
-    def _save_csv_report(self, ebooks: List[Dict[str, Any]], csv_path: str) -> None:
-        """
-        Salva os dados dos ebooks em um arquivo CSV.
-        
-        Args:
-            ebooks: Lista de dicionários com informações dos ebooks
-            csv_path: Caminho para salvar o arquivo CSV
-        """
-        import pandas as pd
-        
-        try:
-            df = pd.DataFrame(ebooks)
-            df.to_csv(csv_path, index=False, encoding='utf-8')
-        except Exception as e:
-            self.logger.error(f"Erro ao salvar relatório CSV: {str(e)}")
-            raise
     
     def _get_verification_code(self):
         """Solicita e retorna o código de verificação 2FA"""
@@ -9,10 +9,12 @@ import logging
 import os
 import csv
 import json
+from operator import itemgetter
 from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from pathlib import Path
 from tempfile import gettempdir
+from urllib.parse import urlparse
 
 from selenium import webdriver
 from selenium.webdriver.common.by import By
@@ -60,9 +62,72 @@ class KindleCloudScanner(Scanner):
         'amazon.de': 'https://read.amazon.de'
     }
 
+    # Colunas do CSV no padrão do eBook Manager
+    CSV_COLUMNS = [
+        'Nome',
+        'Formato',
+        'Tamanho(MB)',
+        'Data Modificação',
+        'Caminho',
+        'ASIN',
+        'Origem',
+        'Tipo_Origem',
+        'Percentual_Lido',
+        'URL_Capa',
+        'Autor'
+    ]
+
     # Timeout padrão (segundos)
     LOGIN_TIMEOUT = 30
     LIBRARY_LOAD_TIMEOUT = 60
+    # Intervalo de verificação da biblioteca (o padrão do WebDriverWait é 0.5s)
+    LIBRARY_POLL_INTERVAL = 0.05
+
+    # Host do Cloud Reader (read.amazon.com, read.amazon.com.br, ...); a página
+    # /landing é a vitrine exibida a visitantes sem sessão
+    READER_HOST_PREFIX = 'read.amazon.'
+    READER_LANDING_PATH = '/landing'
+
+    # Campos do formulário de login (ID da Amazon ou seletor genérico)
+    EMAIL_SELECTOR = "#ap_email, input[type='email']"
+    PASSWORD_SELECTOR = "#ap_password, input[type='password']"
+    SUBMIT_SELECTOR = "#signInSubmit, button[type='submit']"
+
+    # Requisição XHR do Cloud Reader que já devolve a biblioteca em JSON
+    LIBRARY_API_PATH = '/kindle-library/search'
+
+    # Biblioteca pronta: página carregada e ao menos um livro renderizado
+    LIBRARY_READY_SCRIPT = (
+        "return document.readyState === 'complete' && document.querySelector('.book') !== null;"
+    )
+
+    # Lê os campos de todos os elementos .book em uma única ida ao navegador
+    DOM_EXTRACTION_SCRIPT = """
+    const text = (el, selector) => {
+        const node = el.querySelector(selector);
+        return node ? node.innerText.trim() : null;
+    };
+    return Array.from(document.querySelectorAll('.book')).map(el => {
+        const img = el.querySelector('img');
+        const link = el.querySelector('a');
+        return {
+            asin: el.getAttribute('data-asin'),
+            title: text(el, '.book-title'),
+            authors: text(el, '.book-author'),
+            imageUrl: img ? img.src : null,
+            date: text(el, '.acquisition-date'),
+            progress: text(el, '.progress-percent'),
+            href: link ? link.href : null,
+            cls: el.getAttribute('class') || ''
+        };
+    });
+    """
+
+    # Perfil persistente do Chrome: mantém a sessão Amazon entre scans
+    PROFILE_DIRECTORY = os.path.join('~', '.cache', 'ebook_manager', 'chrome_profile')
+
+    # Caminho do ChromeDriver, resolvido uma vez por processo
+    _driver_path: Optional[str] = None
 
     def __init__(self, credential_service: CredentialService, headless: bool = True):
         """
@@ -192,6 +257,9 @@ class KindleCloudScanner(Scanner):
             # Desabilitar modo de aplicativo
             chrome_options.add_argument('--disable-application-cache')
 
+            # Log de desempenho: permite ler as respostas XHR da biblioteca via CDP
+            chrome_options.set_capability('goog:loggingPrefs', {'performance': 'ALL'})
+
             # User agent padrão
             chrome_options.add_argument(
                 'user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) '
@@ -199,7 +267,16 @@ class KindleCloudScanner(Scanner):
                 'Chrome/121.0.0.0 Safari/537.36'
             )
 
-            service = Service(ChromeDriverManager().install())
+            # Reutilizar o perfil para que os cookies de login sobrevivam entre scans
+            profile_directory = os.path.expanduser(self.PROFILE_DIRECTORY)
+            os.makedirs(profile_directory, mode=0o700, exist_ok=True)
+            chrome_options.add_argument(f'--user-data-dir={profile_directory}')
+
+            # ChromeDriverManager().install() consulta disco e rede; basta uma vez
+            if KindleCloudScanner._driver_path is None:
+                KindleCloudScanner._driver_path = ChromeDriverManager().install()
+
+            service = Service(KindleCloudScanner._driver_path)
             self._driver = webdriver.Chrome(service=service, options=chrome_options)
 
             logger.debug("WebDriver Chrome inicializado")
@@ -225,52 +302,48 @@ class KindleCloudScanner(Scanner):
             logger.info("Navegando para Kindle Cloud Reader...")
             self._driver.get(base_url)
 
-            # Aguardar página carregar - tentar múltiplos seletores
+            # Sessão ainda válida no perfil persistente: sem redirecionamento para o
+            # login e com a biblioteca já renderizada
+            if (self._is_reader_url(self._driver.current_url)
+                    and self._driver.execute_script(self.LIBRARY_READY_SCRIPT)):
+                logger.info("Sessão Amazon já autenticada")
+                return True
+
+            # Aguardar o formulário de login (qualquer seletor) ou um redirecionamento
+            # de volta ao Cloud Reader, numa única espera
             try:
                 WebDriverWait(self._driver, self.LOGIN_TIMEOUT).until(
-                    EC.presence_of_element_located((By.ID, "ap_email"))
+                    EC.any_of(
+                        EC.presence_of_element_located((By.CSS_SELECTOR, self.EMAIL_SELECTOR)),
+                        lambda driver: self._is_reader_url(driver.current_url)
+                    )
                 )
-                logger.debug("Campo de email detectado (ID: ap_email)")
             except TimeoutException:
-                logger.warning("Seletor #ap_email não encontrado, tentando alternativas...")
-                try:
-                    WebDriverWait(self._driver, 10).until(
-                        EC.presence_of_element_located((By.CSS_SELECTOR, "input[type='email']"))
-                    )
-                    logger.debug("Campo de email detectado (CSS: input[type='email'])")
-                except TimeoutException:
-                    logger.error("Não foi possível encontrar campo de email em nenhum formato")
-                    logger.error(f"URL atual: {self._driver.current_url}")
-                    logger.error(f"Primeira 500 chars da página: {self._driver.page_source[:500]}")
-                    return False
+                logger.error("Não foi possível encontrar campo de email em nenhum formato")
+                logger.error(f"URL atual: {self._driver.current_url}")
+                logger.error(f"Primeira 500 chars da página: {self._driver.page_source[:500]}")
+                return False
 
-            logger.debug("Página de login detectada")
+            if self._is_reader_url(self._driver.current_url):
+                logger.info("Sessão Amazon já autenticada")
+                return True
 
-            # Preencher email - tentar múltiplos seletores
-            try:
-                email_field = self._driver.find_element(By.ID, "ap_email")
-            except:
-                email_field = self._driver.find_element(By.CSS_SELECTOR, "input[type='email']")
+            logger.debug("Página de login detectada")
 
+            # Preencher email
+            email_field = self._find_login_element(self.EMAIL_SELECTOR)
             email_field.clear()
             email_field.send_keys(email)
             logger.debug("Email preenchido")
 
             # Preencher senha
-            try:
-                password_field = self._driver.find_element(By.ID, "ap_password")
-            except:
-                password_field = self._driver.find_element(By.CSS_SELECTOR, "input[type='password']")
-
+            password_field = self._find_login_element(self.PASSWORD_SELECTOR)
             password_field.clear()
             password_field.send_keys(password)
             logger.debug("Senha preenchida")
 
             # Clicar botão de login
-            try:
-                login_button = self._driver.find_element(By.ID, "signInSubmit")
-            except:
-                login_button = self._driver.find_element(By.CSS_SELECTOR, "button[type='submit']")
+            login_button = self._find_login_element(self.SUBMIT_SELECTOR)
 
             login_button.click()
             logger.debug("Formulário de login enviado")
@@ -289,7 +362,7 @@ class KindleCloudScanner(Scanner):
                 return False
 
             # Verificar se login foi bem-sucedido
-            if "read.amazon" in current_url:
+            if self._is_reader_url(current_url):
                 logger.info("Login bem-sucedido")
                 return True
             else:
@@ -303,6 +376,43 @@ class KindleCloudScanner(Scanner):
             logger.error(f"Erro ao fazer login: {str(e)}", exc_info=True)
             return False
 
+    def _is_reader_url(self, url: str) -> bool:
+        """
+        Verifica se a URL pertence ao Cloud Reader.
+
+        Compara o host, e não a URL inteira: a página de login da Amazon carrega
+        o endereço do Cloud Reader no parâmetro openid.return_to.
+
+        Args:
+            url: URL atual do navegador
+
+        Returns:
+            True se a URL for do Cloud Reader (exceto a página /landing)
+        """
+        parsed = urlparse(url or '')
+        return (
+            parsed.netloc.startswith(self.READER_HOST_PREFIX)
+            and not parsed.path.startswith(self.READER_LANDING_PATH)
+        )
+
+    def _find_login_element(self, selector: str):
+        """
+        Localiza um elemento do formulário de login.
+
+        Args:
+            selector: Seletores CSS alternativos, separados por vírgula
+
+        Returns:
+            Primeiro elemento encontrado
+
+        Raises:
+            NoSuchElementException: Se nenhum seletor corresponder
+        """
+        elements = self._driver.find_elements(By.CSS_SELECTOR, selector)
+        if not elements:
+            raise NoSuchElementException(f"Elemento de login não encontrado: {selector}")
+        return elements[0]
+
     def _extract_library(self, base_url: str) -> List[Dict[str, Any]]:
         """
         Extrai lista de livros da biblioteca.
@@ -318,26 +428,33 @@ class KindleCloudScanner(Scanner):
         try:
             logger.info("Extraindo biblioteca do Kindle Cloud Reader...")
 
-            # Aguardar a página de biblioteca carregar
-            WebDriverWait(self._driver, self.LIBRARY_LOAD_TIMEOUT).until(
-                EC.presence_of_all_elements_located((By.CLASS_NAME, "book"))
-            )
+            # Aguardar a página de biblioteca carregar, verificando com um único
+            # execute_script a cada LIBRARY_POLL_INTERVAL
+            WebDriverWait(
+                self._driver,
+                self.LIBRARY_LOAD_TIMEOUT,
+                poll_frequency=self.LIBRARY_POLL_INTERVAL
+            ).until(lambda driver: driver.execute_script(self.LIBRARY_READY_SCRIPT))
 
             logger.debug("Página da biblioteca carregada")
 
             # Tentar extrair via Web SQL Database (método preferido)
             books = self._extract_from_database()
 
+            if not books:
+                # JSON da própria XHR da biblioteca, sem percorrer o DOM
+                books = self._extract_from_network()
+
             if not books:
                 # Fallback: extrair via DOM
                 logger.debug("Tentando extração via DOM...")
                 books = self._extract_from_dom()
 
-            # Ordenar por data de criação (mais recentes primeiro)
-            books.sort(
-                key=lambda x: x.get('creationDate', 0),
-                reverse=True
-            )
+            # Ordenar por data de criação (mais recentes primeiro); os dados do
+            # Web SQL Database podem vir sem data
+            for book in books:
+                book.setdefault('creationDate', 0)
+            books.sort(key=itemgetter('creationDate'), reverse=True)
 
             logger.info(f"Total de {len(books)} livros extraídos")
             return books
@@ -384,11 +501,91 @@ class KindleCloudScanner(Scanner):
             logger.debug(f"Não foi possível acessar Web SQL Database: {str(e)}")
             return []
 
+    def _extract_from_network(self) -> List[Dict[str, Any]]:
+        """
+        Extrai livros das respostas da XHR de biblioteca já feitas pela página.
+
+        Lê o log de desempenho do Chrome atrás das respostas de LIBRARY_API_PATH
+        e obtém o corpo delas via CDP (Network.getResponseBody).
+
+        Returns:
+            Lista de livros ou lista vazia se nenhuma resposta foi capturada
+        """
+        books = []
+        seen_asins = set()
+
+        try:
+            default_date = int(datetime.now().timestamp() * 1000)
+
+            for entry in self._driver.get_log('performance'):
+                message = json.loads(entry['message'])['message']
+                if message.get('method') != 'Network.responseReceived':
+                    continue
+
+                params = message['params']
+                if self.LIBRARY_API_PATH not in params['response']['url']:
+                    continue
+
+                body = self._driver.execute_cdp_cmd(
+                    'Network.getResponseBody', {'requestId': params['requestId']}
+                )
+                data = json.loads(body['body'])
+
+                for item in data.get('itemsList', []):
+                    book_data = self._normalize_library_item(item, default_date)
+                    if book_data and book_data['asin'] not in seen_asins:
+                        seen_asins.add(book_data['asin'])
+                        books.append(book_data)
+
+            logger.debug(f"Extraídos {len(books)} livros das respostas da biblioteca")
+            return books
+
+        except Exception as e:
+            logger.debug(f"Não foi possível ler a resposta da biblioteca: {str(e)}")
+            return []
+
+    def _normalize_library_item(self, item: Dict[str, Any], default_date: int) -> Optional[Dict[str, Any]]:
+        """
+        Converte um item do JSON da biblioteca para o formato interno.
+
+        Args:
+            item: Item de 'itemsList' da resposta de LIBRARY_API_PATH
+            default_date: Timestamp (ms) usado quando o item não traz data
+
+        Returns:
+            Dicionário com dados do livro ou None se não houver ASIN
+        """
+        asin = item.get('asin')
+        if not asin:
+            return None
+
+        authors = item.get('authors') or "Desconhecido"
+        if isinstance(authors, list):
+            # A API devolve nomes no formato "Sobrenome, Nome:"
+            authors = ", ".join(author.rstrip(':') for author in authors) or "Desconhecido"
+
+        web_reader_url = item.get('webReaderUrl')
+        if not web_reader_url or not web_reader_url.startswith('http'):
+            web_reader_url = f"https://read.amazon.com/reader/{asin}"
+
+        return {
+            'asin': asin,
+            'title': item.get('title') or "Desconhecido",
+            'authors': authors,
+            'imageUrl': item.get('productUrl') or item.get('imageUrl') or "",
+            'creationDate': item.get('creationDate') or default_date,
+            'originType': item.get('originType') or "PURCHASE",
+            'percentageRead': item.get('percentageRead') or 0,
+            'webReaderUrl': web_reader_url
+        }
+
     def _extract_from_dom(self) -> List[Dict[str, Any]]:
         """
         Extrai livros pelo DOM da página.
 
-        Fallback se Web SQL Database não estiver disponível.
+        Fallback se Web SQL Database não estiver disponível. Todos os campos
+        são lidos no navegador por um único execute_script, em vez de vários
+        find_element/get_attribute (uma chamada ao chromedriver cada) por livro.
 
         Returns:
             Lista de livros extraídos do DOM
@@ -396,18 +593,16 @@ class KindleCloudScanner(Scanner):
         books = []
 
         try:
-            # Encontrar todos os elementos de livro
-            book_elements = self._driver.find_elements(By.CLASS_NAME, "book")
-            logger.debug(f"Encontrados {len(book_elements)} elementos de livro no DOM")
+            raw_books = self._driver.execute_script(self.DOM_EXTRACTION_SCRIPT) or []
+            logger.debug(f"Encontrados {len(raw_books)} elementos de livro no DOM")
 
-            for book_elem in book_elements:
-                try:
-                    book_data = self._extract_book_data(book_elem)
-                    if book_data:
-                        books.append(book_data)
-                except Exception as e:
-                    logger.debug(f"Erro ao extrair livro individual: {str(e)}")
-                    continue
+            # Data padrão (agora) para livros sem data de aquisição legível
+            default_date = int(datetime.now().timestamp() * 1000)
+
+            for raw_book in raw_books:
+                book_data = self._extract_book_data(raw_book, default_date)
+                if book_data:
+                    books.append(book_data)
 
             logger.debug(f"Total de {len(books)} livros extraídos do DOM")
             return books
@@ -416,71 +611,54 @@ class KindleCloudScanner(Scanner):
             logger.debug(f"Erro ao extrair do DOM: {str(e)}")
             return []
 
-    def _extract_book_data(self, element) -> Optional[Dict[str, Any]]:
+    def _extract_book_data(self, raw_book: Dict[str, Any], default_date: int) -> Optional[Dict[str, Any]]:
         """
-        Extrai dados de um livro individual.
+        Converte os campos brutos de um livro lidos do DOM.
 
         Args:
-            element: Elemento Selenium contendo dados do livro
+            raw_book: Campos retornados por DOM_EXTRACTION_SCRIPT
+            default_date: Timestamp (ms) usado quando a data não pode ser lida
 
         Returns:
             Dicionário com dados do livro ou None
         """
         try:
-            # Tentar extrair ASIN do atributo data-asin
-            asin = element.get_attribute('data-asin')
+            asin = raw_book.get('asin')
             if not asin:
                 return None
 
-            # Extrair título
-            title_elem = element.find_element(By.CLASS_NAME, "book-title")
-            title = title_elem.text.strip() if title_elem else "Desconhecido"
-
-            # Extrair autor
-            author_elem = element.find_element(By.CLASS_NAME, "book-author")
-            authors = author_elem.text.strip() if author_elem else "Desconhecido"
-
-            # Extrair URL da capa
-            image_elem = element.find_element(By.TAG_NAME, "img")
-            image_url = image_elem.get_attribute('src') if image_elem else ""
-
-            # Extrair data (pode estar em atributo ou texto)
-            creation_date = int(datetime.now().timestamp() * 1000)  # Default: agora
-            date_elem = element.find_element(By.CLASS_NAME, "acquisition-date")
-            if date_elem:
-                # Tentar parse da data
+            # Extrair data (dd/mm/aaaa)
+            creation_date = default_date
+            date_text = raw_book.get('date')
+            if date_text:
                 try:
-                    date_text = date_elem.text.strip()
                     parsed_date = datetime.strptime(date_text, "%d/%m/%Y")
                     creation_date = int(parsed_date.timestamp() * 1000)
-                except:
+                except ValueError:
                     pass
 
             # Extrair tipo de origem
             origin_type = "PURCHASE"  # Default
-            if "Prime Reading" in element.get_attribute('class') or "prime" in element.get_attribute('class'):
+            css_class = raw_book.get('cls') or ''
+            if "Prime Reading" in css_class or "prime" in css_class:
                 origin_type = "PRIME_READING"
 
             # Extrair percentual lido
-            progress_elem = element.find_element(By.CLASS_NAME, "progress-percent")
             percentage_read = 0
-            if progress_elem:
-                try:
-                    text = progress_elem.text.strip()
-                    percentage_read = int(''.join(filter(str.isdigit, text)))
-                except:
-                    pass
+            digits = ''.join(filter(str.isdigit, raw_book.get('progress') or ''))
+            if digits:
+                percentage_read = int(digits)
 
             # URL para ler online
-            web_reader_url = element.find_element(By.TAG_NAME, "a").get_attribute('href')
+            web_reader_url = raw_book.get('href')
             if not web_reader_url or not web_reader_url.startswith('http'):
                 web_reader_url = f"https://read.amazon.com/reader/{asin}"
 
             return {
                 'asin': asin,
-                'title': title,
-                'authors': authors,
-                'imageUrl': image_url,
+                'title': raw_book.get('title') or "Desconhecido",
+                'authors': raw_book.get('authors') or "Desconhecido",
+                'imageUrl': raw_book.get('imageUrl') or "",
                 'creationDate': creation_date,
                 'originType': origin_type,
                 'percentageRead': percentage_read,
@@ -510,43 +688,28 @@ class KindleCloudScanner(Scanner):
             filename = f"kindle_temp_{timestamp}.csv"
             csv_path = os.path.join(gettempdir(), filename)
 
-            # Definir colunas no padrão do eBook Manager
-            fieldnames = [
-                'Nome',
-                'Formato',
-                'Tamanho(MB)',
-                'Data Modificação',
-                'Caminho',
-                'ASIN',
-                'Origem',
-                'Tipo_Origem',
-                'Percentual_Lido',
-                'URL_Capa',
-                'Autor'
-            ]
-
-            # Escrever CSV
+            # Escrever CSV (linhas posicionais, na ordem de CSV_COLUMNS)
+            fromtimestamp = datetime.fromtimestamp
             with open(csv_path, 'w', newline='', encoding='utf-8') as csvfile:
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                writer.writeheader()
-
-                for book in books:
-                    # Converter timestamp para datetime
-                    creation_date = datetime.fromtimestamp(book['creationDate'] / 1000)
-
-                    writer.writerow({
-                        'Nome': book['title'],
-                        'Formato': 'AZW3/KFX',
-                        'Tamanho(MB)': 0,
-                        'Data Modificação': creation_date.strftime('%d/%m/%Y %H:%M'),
-                        'Caminho': book['webReaderUrl'],
-                        'ASIN': book['asin'],
-                        'Origem': 'Kindle',
-                        'Tipo_Origem': book['originType'],
-                        'Percentual_Lido': book['percentageRead'],
-                        'URL_Capa': book['imageUrl'],
-                        'Autor': book['authors']
-                    })
+                writer = csv.writer(csvfile)
+                writer.writerow(self.CSV_COLUMNS)
+                writer.writerows(
+                    (
+                        book['title'],
+                        'AZW3/KFX',
+                        0,
+                        # Converter timestamp (ms) para data
+                        fromtimestamp(book['creationDate'] / 1000).strftime('%d/%m/%Y %H:%M'),
+                        book['webReaderUrl'],
+                        book['asin'],
+                        'Kindle',
+                        book['originType'],
+                        book['percentageRead'],
+                        book['imageUrl'],
+                        book['authors']
+                    )
+                    for book in books
+                )
 
             logger.info(f"CSV salvo em: {csv_path}")
             return csv_path
@@ -20,5 +20,6 @@ class NotionExportConfig:
     max_retries: int = 3
     
     # Additional options
-    batch_size: int = 10
+    batch_size: int = 10  # Records read from the CSV per export chunk
+    concurrency: int = 3  # Records of a chunk exported in parallel
     retry_on_error: bool = True
\ No newline at end of file
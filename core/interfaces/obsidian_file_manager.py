@@ -1,5 +1,5 @@
 # core/interfaces/obsidian_file_manager.py
-from typing import Protocol, Optional
+from typing import Protocol, Optional, Iterable
 
 
 class ObsidianFileManager(Protocol):
@@ -66,6 +66,18 @@ class ObsidianFileManager(Protocol):
         """
         ...
 
+    def prime_existence_cache(self, folders: Iterable[str]) -> None:
+        """
+        Snapshot the existing notes of the given folders before a bulk export.
+
+        Implementations may then answer note_exists from the snapshot instead
+        of checking each note individually.
+
+        Args:
+            folders: Folder paths relative to vault root
+        """
+        ...
+
     def get_note_content(self, folder: str, filename: str) -> Optional[str]:
         """
         Get the content of an existing note.
@@ -1,13 +1,18 @@
 # core/services/notion_export_service.py
 import logging
 import csv
-from typing import Dict, Any, Optional, List, Tuple
+import io
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from itertools import islice
+from typing import Dict, Any, Optional, List, Tuple, Iterable, Iterator
 
 from core.domain.notion_export_config import NotionExportConfig
 from core.interfaces.notion_api_client import NotionApiClient
 from core.interfaces.notion_database_verifier import NotionDatabaseVerifier
 from core.interfaces.notion_database_creator import NotionDatabaseCreator
 from core.interfaces.notion_record_mapper import NotionRecordMapper
+from utils.csv_utils import count_csv_rows
 
 class NotionExportError(Exception):
     """Exception raised for errors during Notion export."""
@@ -65,76 +70,43 @@ class NotionExportService:
             error_count = 0
             error_messages = []
 
-            # Read CSV and count rows
-            total_rows = sum(1 for _ in open(csv_path, 'r', encoding='utf-8')) - 1  # -1 for header
-            self.logger.info(f"Starting export of {total_rows} records from {csv_path}")
-
-            with open(csv_path, 'r', encoding='utf-8') as f:
-                reader = csv.DictReader(f)
-
-                for i, record in enumerate(reader):
-                    try:
-                        # Map record to Notion properties, icon, and cover
-                        properties, icon, cover = self.record_mapper.map_to_notion_properties_and_icon(record)
-
-                        # Create page in Notion with icon and cover
-                        page = self.api_client.create_page(database_id, properties, icon, cover)
-                        page_id = page["id"]
-                        self.logger.debug(f"Created page {page_id} for record {i+1}")
-
-                        # Retrieve the page to get the actual cover URL that Notion accepted
-                        # This ensures we use the exact same URL format that worked for the cover
-                        page_data = self.api_client.get_page(page_id)
-                        reusable_image_url = self._get_reusable_image_url(page_data)
-
-                        # Create content blocks, passing the reusable image URL
-                        blocks = self.record_mapper.create_page_content_blocks(record, reusable_image_url)
-
-                        # Add content blocks to page
-                        if blocks:
-                            try:
-                                self.api_client.append_blocks_to_page(page_id, blocks)
-                                self.logger.debug(f"Added {len(blocks)} content blocks to page {page_id}")
-                            except Exception as block_error:
-                                self.logger.error(f"Error adding content blocks: {str(block_error)}")
-
-                                # Try to add blocks one by one to identify and skip problematic ones
-                                successful_blocks = 0
-                                for j, block in enumerate(blocks):
-                                    try:
-                                        # Verify text content length for paragraph blocks
-                                        if block.get("type") == "paragraph":
-                                            rich_text = block.get("paragraph", {}).get("rich_text", [])
-                                            for text_item in rich_text:
-                                                content = text_item.get("text", {}).get("content", "")
-                                                if len(content) > 1900:  # Using 1900 as a safety margin
-                                                    self.logger.warning(f"Truncating oversized text block ({len(content)} chars)")
-                                                    text_item["text"]["content"] = content[:1900] + "..."
-
-                                        # Add individual block
-                                        self.api_client.append_blocks_to_page(page_id, [block])
-                                        successful_blocks += 1
-                                    except Exception as e:
-                                        self.logger.warning(f"Skipping problematic block {j}: {str(e)}")
-
-                                self.logger.info(f"Added {successful_blocks}/{len(blocks)} blocks with fallback method")
-
-                        success_count += 1
-
-                        # Log progress
-                        if i % 10 == 0 or i == total_rows - 1:
-                            self.logger.info(f"Progress: {i+1}/{total_rows} records processed")
-
-                    except Exception as e:
-                        error_count += 1
-                        error_msg = f"Error exporting record {i+1}: {str(e)}"
-                        error_messages.append(error_msg)
-                        self.logger.error(error_msg)
-
-                        # Only store up to 10 error messages to avoid excessive memory usage
-                        if len(error_messages) > 10:
-                            error_messages.append("Additional errors omitted...")
-                            break
+            # Opened once: counting restores the read position
+            with open(csv_path, 'rb') as raw:
+                # Count rows for progress logging
+                total_rows = count_csv_rows(raw)
+                self.logger.info(f"Starting export of {total_rows} records from {csv_path}")
+
+                reader = csv.DictReader(io.TextIOWrapper(raw, encoding='utf-8', newline=''))
+                processed = 0
+
+                error_limit_reached = False
+
+                for chunk in self._iter_chunks(reader, self.config.batch_size):
+                    # Closing the results cancels the records of the chunk not yet started
+                    with closing(self._export_chunk(database_id, chunk, processed)) as results:
+                        for offset, error_msg in enumerate(results):
+                            i = processed + offset
+                            if error_msg is None:
+                                success_count += 1
+
+                                # Log progress
+                                if i % 10 == 0 or i == total_rows - 1:
+                                    self.logger.info(f"Progress: {i+1}/{total_rows} records processed")
+                            else:
+                                error_count += 1
+                                error_messages.append(error_msg)
+                                self.logger.error(error_msg)
+
+                                # Only store up to 10 error messages to avoid excessive memory usage
+                                if len(error_messages) > 10:
+                                    error_messages.append("Additional errors omitted...")
+                                    error_limit_reached = True
+                                    break
+
+                    if error_limit_reached:
+                        break
+
+                    processed += len(chunk)
                             
             self.logger.info(f"Export completed: {success_count} succeeded, {error_count} failed")
             return success_count > 0, success_count, error_count, error_messages
@@ -144,6 +116,137 @@ class NotionExportService:
             self.logger.error(error_msg)
             raise NotionExportError(error_msg) from e
     
+    def _iter_chunks(self, records: Iterable[Dict[str, Any]], chunk_size: int) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Groups a stream of records into lists of at most chunk_size records.
+
+        Only one chunk is held in memory at a time, so the CSV is never
+        materialized as a whole.
+
+        Args:
+            records: Record iterator (e.g. a csv.DictReader)
+            chunk_size: Maximum number of records per chunk
+
+        Yields:
+            Lists of records
+        """
+        iterator = iter(records)
+        chunk_size = max(1, chunk_size)
+        while True:
+            chunk = list(islice(iterator, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    def _export_chunk(self, database_id: str, chunk: List[Dict[str, Any]], start_index: int) -> Iterator[Optional[str]]:
+        """
+        Exports a chunk of records to Notion.
+
+        Results are yielded in CSV order as each record finishes, so the caller
+        can stop at the error limit; closing the iterator cancels the records
+        that have not started yet.
+
+        Args:
+            database_id: Target database ID
+            chunk: Records to export
+            start_index: Zero-based position of the first record in the CSV
+
+        Yields:
+            One entry per record: None on success, error message on failure
+        """
+        workers = min(self.config.concurrency, len(chunk))
+        if workers <= 1:
+            for offset, record in enumerate(chunk):
+                yield self._export_record(database_id, record, start_index + offset)
+            return
+
+        # Records are independent pages, so overlap their API round-trips
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._export_record, database_id, record, start_index + offset)
+                for offset, record in enumerate(chunk)
+            ]
+            try:
+                for future in futures:
+                    yield future.result()
+            finally:
+                for future in futures:
+                    future.cancel()
+
+    def _export_record(self, database_id: str, record: Dict[str, Any], i: int) -> Optional[str]:
+        """
+        Exports a single record as a Notion page with its content blocks.
+
+        Args:
+            database_id: Target database ID
+            record: Record data from CSV
+            i: Zero-based position of the record in the CSV
+
+        Returns:
+            None on success, error message on failure
+        """
+        try:
+            # Map record to Notion properties, icon, and cover
+            properties, icon, cover = self.record_mapper.map_to_notion_properties_and_icon(record)
+
+            # Create page in Notion with icon and cover
+            page = self.api_client.create_page(database_id, properties, icon, cover)
+            page_id = page["id"]
+            self.logger.debug(f"Created page {page_id} for record {i+1}")
+
+            # Retrieve the page to get the actual cover URL that Notion accepted
+            # This ensures we use the exact same URL format that worked for the cover
+            page_data = self.api_client.get_page(page_id)
+            reusable_image_url = self._get_reusable_image_url(page_data)
+
+            # Create content blocks, passing the reusable image URL
+            blocks = self.record_mapper.create_page_content_blocks(record, reusable_image_url)
+
+            # Add content blocks to page
+            if blocks:
+                self._append_blocks(page_id, blocks)
+
+            return None
+
+        except Exception as e:
+            return f"Error exporting record {i+1}: {str(e)}"
+
+    def _append_blocks(self, page_id: str, blocks: List[Dict[str, Any]]) -> None:
+        """
+        Appends content blocks to a page, falling back to one-by-one appends
+        so a single problematic block does not drop the rest.
+
+        Args:
+            page_id: Page ID
+            blocks: List of block objects
+        """
+        try:
+            self.api_client.append_blocks_to_page(page_id, blocks)
+            self.logger.debug(f"Added {len(blocks)} content blocks to page {page_id}")
+        except Exception as block_error:
+            self.logger.error(f"Error adding content blocks: {str(block_error)}")
+
+            # Try to add blocks one by one to identify and skip problematic ones
+            successful_blocks = 0
+            for j, block in enumerate(blocks):
+                try:
+                    # Verify text content length for paragraph blocks
+                    if block.get("type") == "paragraph":
+                        rich_text = block.get("paragraph", {}).get("rich_text", [])
+                        for text_item in rich_text:
+                            content = text_item.get("text", {}).get("content", "")
+                            if len(content) > 1900:  # Using 1900 as a safety margin
+                                self.logger.warning(f"Truncating oversized text block ({len(content)} chars)")
+                                text_item["text"]["content"] = content[:1900] + "..."
+
+                    # Add individual block
+                    self.api_client.append_blocks_to_page(page_id, [block])
+                    successful_blocks += 1
+                except Exception as e:
+                    self.logger.warning(f"Skipping problematic block {j}: {str(e)}")
+
+            self.logger.info(f"Added {successful_blocks}/{len(blocks)} blocks with fallback method")
+
     def _ensure_database_exists(self) -> Optional[str]:
         """
         Ensures a valid database exists, creating one if necessary.
@@ -82,6 +82,8 @@ class ObsidianExportService:
             self.logger.info(f"Ensuring notes folder exists: {self.config.notes_folder}")
             self.file_manager.ensure_folder_exists(self.config.notes_folder)
             self.logger.debug(f"Notes folder ready: {self.config.notes_folder}")
+            # One listing of the notes folder instead of a check per record
+            self.file_manager.prime_existence_cache([self.config.notes_folder])
         except Exception as e:
             self.logger.error(f"Failed to create notes folder: {str(e)}")
             raise ObsidianExportError(f"Failed to create notes folder: {str(e)}") from e
@@ -0,0 +1 @@
+# tests/adapters/notion/__init__.py
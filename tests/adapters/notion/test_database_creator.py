@@ -0,0 +1,49 @@
+# tests/adapters/notion/test_database_creator.py
+import unittest
+from unittest.mock import Mock
+from adapters.notion.database_creator import DefaultNotionDatabaseCreator
+from adapters.notion.database_verifier import DefaultNotionDatabaseVerifier
+
+
+class TestDefaultNotionDatabaseCreator(unittest.TestCase):
+    """Unit tests for DefaultNotionDatabaseCreator."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        DefaultNotionDatabaseCreator._properties_cache.clear()
+        self.api_client = Mock()
+        self.api_client.create_database.return_value = {"id": "db-id"}
+
+    def tearDown(self):
+        """Drop payloads cached by the test."""
+        DefaultNotionDatabaseCreator._properties_cache.clear()
+
+    def test_create_database_builds_select_options(self):
+        """Test the properties payload sent to the API."""
+        creator = DefaultNotionDatabaseCreator(self.api_client, DefaultNotionDatabaseVerifier(self.api_client))
+
+        self.assertEqual(creator.create_database("page-id", "Library"), "db-id")
+
+        properties = self.api_client.create_database.call_args.args[2]
+        self.assertEqual(properties["Title"], {"title": {}})
+        self.assertEqual(
+            properties["Format"]["select"]["options"],
+            DefaultNotionDatabaseCreator.SELECT_OPTIONS["Format"]
+        )
+
+    def test_properties_payload_shared_across_creators(self):
+        """Test that the payload is built once and reused by every creator instance."""
+        verifier = DefaultNotionDatabaseVerifier(self.api_client)
+        first = DefaultNotionDatabaseCreator(self.api_client, verifier)
+        second = DefaultNotionDatabaseCreator(self.api_client, DefaultNotionDatabaseVerifier(self.api_client))
+
+        first.create_database("page-id", "Library")
+        second.create_database("page-id", "Library")
+
+        first_payload = self.api_client.create_database.call_args_list[0].args[2]
+        second_payload = self.api_client.create_database.call_args_list[1].args[2]
+        self.assertIs(first_payload, second_payload)
+
+
+if __name__ == '__main__':
+    unittest.main()
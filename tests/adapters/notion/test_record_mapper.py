@@ -0,0 +1,73 @@
+# tests/adapters/notion/test_record_mapper.py
+import unittest
+from datetime import datetime
+from adapters.notion.record_mapper import GoogleBooksNotionRecordMapper
+
+
+class TestGoogleBooksNotionRecordMapperDates(unittest.TestCase):
+    """Unit tests for GoogleBooksNotionRecordMapper.parse_date."""
+
+    # Formats tried, in order, by the strptime loop that DATE_PATTERN replaced
+    STRPTIME_FORMATS = (
+        '%Y-%m-%d %H:%M:%S',
+        '%Y-%m-%d',
+        '%Y-%m-%d %H:%M',
+        '%d/%m/%Y',
+        '%d-%m-%Y',
+        '%Y/%m/%d'
+    )
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.mapper = GoogleBooksNotionRecordMapper()
+
+    def _parse_with_strptime(self, date_str):
+        """Reference implementation: the former strptime loop."""
+        for fmt in self.STRPTIME_FORMATS:
+            try:
+                return datetime.strptime(date_str, fmt)
+            except ValueError:
+                continue
+        return None
+
+    def _assert_same_as_strptime(self, date_str):
+        """Assert parse_date agrees with the strptime loop."""
+        self.assertEqual(
+            self.mapper.parse_date(date_str),
+            self._parse_with_strptime(date_str),
+            repr(date_str)
+        )
+
+    def test_parse_date_only(self):
+        """Test date-only inputs in every accepted layout."""
+        for date_str in ("2024-03-05", "2024-3-5", "2024/03/05", "05/03/2024", "5-3-2024"):
+            self._assert_same_as_strptime(date_str)
+        self.assertEqual(self.mapper.parse_date("05/03/2024"), datetime(2024, 3, 5))
+
+    def test_parse_date_with_time(self):
+        """Test dates followed by a time, with and without seconds."""
+        for date_str in ("2024-03-05 14:30:15", "2024-03-05 14:30", "2024-03-05 4:05:09"):
+            self._assert_same_as_strptime(date_str)
+        self.assertEqual(self.mapper.parse_date("2024-03-05 14:30:15"), datetime(2024, 3, 5, 14, 30, 15))
+
+    def test_parse_date_iso_t_separator_not_accepted(self):
+        """Test that ISO 8601 'T' timestamps stay unparsed, as with strptime."""
+        for date_str in ("2024-03-05T14:30:15", "2024-03-05T14:30"):
+            self._assert_same_as_strptime(date_str)
+            self.assertIsNone(self.mapper.parse_date(date_str))
+
+    def test_parse_date_invalid(self):
+        """Test inputs that are not dates or not real calendar dates."""
+        for date_str in ("", "not a date", "2024-13-01", "31/02/2024", "2024-03-05 25:00",
+                         "2024/03/05 10:00", "05/03-2024", "20240305"):
+            self._assert_same_as_strptime(date_str)
+            self.assertIsNone(self.mapper.parse_date(date_str))
+
+    def test_parse_date_space_padded_day_differs(self):
+        """Test the known difference: strptime accepts a space-padded day, DATE_PATTERN does not."""
+        self.assertEqual(self._parse_with_strptime(" 5/03/2024"), datetime(2024, 3, 5))
+        self.assertIsNone(self.mapper.parse_date(" 5/03/2024"))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -128,6 +128,18 @@ class TestFilesystemFileManager(unittest.TestCase):
 
         self.assertFalse(exists)
 
+    def test_note_exists_uses_primed_snapshot(self):
+        """Test note_exists answers from the primed snapshot and tracks new notes."""
+        self.manager.create_note("Books", "old.md", "# Old")
+        self.manager.prime_existence_cache(["Books", "Empty"])
+
+        self.manager.create_note("Books", "new.md", "# New")
+
+        self.assertTrue(self.manager.note_exists("Books", "old.md"))
+        self.assertTrue(self.manager.note_exists("Books", "new.md"))
+        self.assertFalse(self.manager.note_exists("Books", "missing.md"))
+        self.assertFalse(self.manager.note_exists("Empty", "old.md"))
+
     def test_get_note_content_success(self):
         """Test getting content of existing note."""
         content = "# Test Note\n\nContent here."
@@ -191,6 +203,16 @@ class TestFilesystemFileManager(unittest.TestCase):
 
         self.assertIn("not a directory", str(context.exception))
 
+    def test_create_note_recreates_folder_removed_after_caching(self):
+        """Test create_note recreates a known folder that was deleted externally."""
+        self.manager.create_note("Books", "book1.md", "# Book 1")
+        shutil.rmtree(self.vault_path / "Books")
+
+        result = self.manager.create_note("Books", "book2.md", "# Book 2")
+
+        self.assertTrue(result)
+        self.assertTrue((self.vault_path / "Books" / "book2.md").exists())
+
     def test_create_multiple_notes_in_same_folder(self):
         """Test creating multiple notes in the same folder."""
         self.manager.create_note("Books", "book1.md", "# Book 1")
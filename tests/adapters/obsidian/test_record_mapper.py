@@ -308,6 +308,18 @@ class TestGoogleBooksObsidianRecordMapper(unittest.TestCase):
         self.assertIn("Programming", result["topics"])
         self.assertIn("Software", result["topics"])
 
+    def test_map_record_topics_deduplicated_in_order(self):
+        """Test duplicate topics are dropped while keeping the original order."""
+        record = {
+            "Nome": "test.pdf",
+            "Formato": "pdf",
+            "Temas_Sugeridos": "Python, Data Science; Python, Algorithms"
+        }
+
+        result = self.mapper.map_record(record, self.config)
+
+        self.assertEqual(result["topics"], "[Python, Data Science, Algorithms]")
+
     def test_map_record_topics_empty_when_missing(self):
         """Test topics is empty list when no source available."""
         record = {
@@ -0,0 +1,127 @@
+"""
+Testes para FileSystemScanner.
+
+Testes unitários da varredura com os.scandir e do relatório CSV gerado.
+"""
+
+import csv
+import os
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from adapters.scanners.filesystem_scanner import FileSystemScanner
+
+
+class TestFileSystemScanner(unittest.TestCase):
+    """Testes para FileSystemScanner."""
+
+    def setUp(self):
+        """Cria uma biblioteca de teste com subpastas e arquivos que não são ebooks."""
+        self.scanner = FileSystemScanner()
+        self.temp_dir = tempfile.mkdtemp()
+        self.library = os.path.join(self.temp_dir, 'biblioteca')
+        self._write('livro.epub', b'x' * 1024)
+        self._write('Manual.PDF', b'pdf')
+        self._write('notas.docx', b'doc')
+        self._write('.epub', b'oculto')
+        self._write(os.path.join('ficcao', 'romance.mobi'), b'mobi')
+        self._write(os.path.join('ficcao', 'contos', 'curto.azw3'), b'azw3')
+
+    def tearDown(self):
+        """Remove a biblioteca de teste."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def _write(self, relative_path, data):
+        """Cria um arquivo dentro da biblioteca de teste."""
+        file_path = os.path.join(self.library, relative_path)
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        with open(file_path, 'wb') as f:
+            f.write(data)
+        return file_path
+
+    def _scanned_names(self, scan_workers=1):
+        """Nomes dos ebooks encontrados por _scan_folder."""
+        return sorted(row[0] for row in self.scanner._scan_folder(self.library, scan_workers))
+
+    def test_classify_hidden_and_unknown_files(self):
+        """Testa a regra de arquivos ocultos e extensões desconhecidas."""
+        self.assertEqual(self.scanner._classify('livro.epub'), 'EPUB')
+        self.assertEqual(self.scanner._classify('Manual.PDF'), 'PDF')
+        self.assertEqual(self.scanner._classify('.livro.epub'), 'EPUB')
+        self.assertIsNone(self.scanner._classify('.epub'))
+        self.assertIsNone(self.scanner._classify('epub'))
+        self.assertIsNone(self.scanner._classify('notas.docx'))
+
+    def test_scan_folder_walks_subfolders(self):
+        """Testa que a varredura desce nas subpastas e ignora o que não é ebook."""
+        self.assertEqual(
+            self._scanned_names(),
+            ['Manual.PDF', 'curto.azw3', 'livro.epub', 'romance.mobi']
+        )
+
+    def test_scan_folder_row_layout(self):
+        """Testa que cada linha segue a ordem de CSV_COLUMNS."""
+        rows = {row[0]: row for row in self.scanner._scan_folder(self.library)}
+        nome, formato, tamanho, data, caminho = rows['livro.epub']
+
+        self.assertEqual(formato, 'EPUB')
+        self.assertEqual(tamanho, round(1024 / (1024 * 1024), 2))
+        self.assertRegex(data, r'^\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}$')
+        self.assertEqual(caminho, os.path.join(self.library, 'livro.epub'))
+
+    @unittest.skipUnless(hasattr(os, 'symlink'), 'links simbólicos indisponíveis')
+    def test_scan_folder_does_not_follow_directory_links(self):
+        """Testa que links para pastas não são seguidos, como no os.walk."""
+        outside = os.path.join(self.temp_dir, 'fora')
+        os.makedirs(outside)
+        with open(os.path.join(outside, 'externo.epub'), 'wb') as f:
+            f.write(b'x')
+        os.symlink(outside, os.path.join(self.library, 'atalho'))
+
+        self.assertNotIn('externo.epub', self._scanned_names())
+
+    def test_scan_folder_with_workers_matches_serial(self):
+        """Testa que o stat em paralelo (scan_workers > 1) encontra os mesmos ebooks."""
+        self.assertEqual(self._scanned_names(scan_workers=4), self._scanned_names())
+
+    def test_scan_folder_with_workers_skips_unreadable(self):
+        """Testa que arquivos que somem antes do stat são ignorados no caminho paralelo."""
+        with patch.object(self.scanner, '_stat_one', side_effect=lambda p: None if p.endswith('.mobi') else os.stat(p)):
+            names = self._scanned_names(scan_workers=2)
+
+        self.assertNotIn('romance.mobi', names)
+        self.assertIn('livro.epub', names)
+
+    def test_scan_writes_csv_report(self):
+        """Testa o relatório CSV gerado por scan."""
+        with patch('os.getcwd', return_value=self.temp_dir):
+            csv_path = self.scanner.scan(self.library, {'scan_workers': 2})
+
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            rows = list(csv.reader(f))
+
+        self.assertEqual(rows[0], self.scanner.CSV_COLUMNS)
+        self.assertEqual(len(rows), 5)
+
+    def test_scan_missing_folder(self):
+        """Testa scan de uma pasta inexistente."""
+        self.assertIsNone(self.scanner.scan(os.path.join(self.temp_dir, 'inexistente')))
+
+    def test_save_csv_report_removes_partial_file(self):
+        """Testa que um relatório interrompido não fica pela metade."""
+        csv_path = os.path.join(self.temp_dir, 'relatorio.csv')
+
+        def rows():
+            yield ('livro.epub', 'EPUB', 0.1, '2024-01-01 00:00:00', '/livro.epub')
+            raise OSError('falha de leitura')
+
+        with self.assertRaises(OSError):
+            self.scanner._save_csv_report(rows(), csv_path)
+
+        self.assertFalse(os.path.exists(csv_path))
+
+
+if __name__ == '__main__':
+    unittest.main()
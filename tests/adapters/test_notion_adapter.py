@@ -0,0 +1,254 @@
+"""
+Testes para NotionExporter.
+
+Testes unitários do exportador legado do Notion, com a sessão HTTP simulada.
+"""
+
+import csv
+import io
+import json
+import unittest
+from unittest.mock import MagicMock, patch
+
+import requests
+
+from adapters.notion_adapter import NotionExporter
+
+
+class TestNotionExporter(unittest.TestCase):
+    """Testes para NotionExporter."""
+
+    def setUp(self):
+        """Configura o ambiente de teste."""
+        self.exporter = NotionExporter(token='secret', database_id='db-id')
+        self.exporter.session = MagicMock()
+        self.exporter.REQUEST_INTERVAL = 0
+
+    def _response(self, status_code, json_data=None, headers=None):
+        """Cria uma resposta simulada da API."""
+        response = MagicMock()
+        response.status_code = status_code
+        response.headers = headers or {}
+        response.json.return_value = json_data or {}
+        response.text = ''
+        return response
+
+    def _posted_payload(self):
+        """Recupera o corpo JSON do último POST (json= ou data= com orjson)."""
+        kwargs = self.exporter.session.post.call_args.kwargs
+        return kwargs['json'] if 'json' in kwargs else json.loads(kwargs['data'])
+
+    def test_add_ebook_sends_content_without_image_blocks(self):
+        """Testa que a capa não vira bloco de imagem e a página é criada numa única requisição."""
+        self.exporter.session.post.return_value = self._response(200, {'id': 'page-id'})
+        ebook = {
+            'Nome': 'livro.epub',
+            'GB_Titulo': 'Livro',
+            'GB_Descricao': 'Descrição do livro',
+            'GB_Capa_Link': 'http://books.google.com/capa.jpg'
+        }
+
+        page_id = self.exporter.add_ebook(ebook)
+
+        self.assertEqual(page_id, 'page-id')
+        self.assertEqual(self.exporter.session.post.call_count, 1)
+        payload = self._posted_payload()
+        children = payload['children']
+        self.assertTrue(children)
+        self.assertNotIn('image', [block['type'] for block in children])
+        self.assertNotEqual(children[-1], self.exporter._record_mapper.EMPTY_PARAGRAPH_BLOCK)
+        self.assertEqual(payload['icon']['external']['url'], 'http://books.google.com/capa.jpg')
+
+    def test_add_ebook_cover_only_has_no_children(self):
+        """Testa que uma linha cujo único dado do Google Books é a capa não recebe conteúdo."""
+        self.exporter.session.post.return_value = self._response(200, {'id': 'page-id'})
+        ebook = {
+            'Nome': 'livro.epub',
+            'GB_Capa_Link': 'https://books.google.com/capa.jpg'
+        }
+
+        page_id = self.exporter.add_ebook(ebook)
+
+        self.assertEqual(page_id, 'page-id')
+        payload = self._posted_payload()
+        self.assertNotIn('children', payload)
+        self.assertEqual(payload['icon']['external']['url'], 'https://books.google.com/capa.jpg')
+
+    def test_concurrency_change_closes_previous_pool(self):
+        """Testa que mudar notion_concurrency fecha o pool de conexões anterior."""
+        exporter = NotionExporter(token='secret', database_id='db-id')
+        previous = exporter.session.get_adapter('https://')
+
+        with patch.object(previous, 'close') as mock_close, \
+                patch.object(exporter, 'import_ebooks_from_csv', return_value=True):
+            exporter.export('livros.csv', {'notion_concurrency': 16})
+
+        mock_close.assert_called()
+        adapter = exporter.session.get_adapter('https://')
+        self.assertIsNot(adapter, previous)
+        self.assertEqual(adapter._pool_maxsize, 16)
+        self.assertEqual(exporter.max_workers, 16)
+
+    def test_export_closes_session(self):
+        """Testa que export fecha a sessão HTTP, mesmo quando a importação falha."""
+        result = self.exporter.export('/caminho/inexistente.csv')
+
+        self.assertFalse(result)
+        self.exporter.session.close.assert_called_once()
+
+    @patch('adapters.notion_adapter.time.sleep')
+    def test_post_with_retry_honors_retry_after(self, mock_sleep):
+        """Testa que um 429 espera o Retry-After informado antes de repetir."""
+        self.exporter.session.post.side_effect = [
+            self._response(429, headers={'Retry-After': '7'}),
+            self._response(200)
+        ]
+
+        response = self.exporter._post_with_retry('https://api.notion.com/v1/pages', {})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.exporter.session.post.call_count, 2)
+        mock_sleep.assert_called_once_with(7.0)
+
+    @patch('adapters.notion_adapter.time.sleep')
+    def test_post_with_retry_recovers_from_unavailable(self, mock_sleep):
+        """Testa que respostas 503 e 429 são repetidas até o sucesso."""
+        self.exporter.session.post.side_effect = [
+            self._response(503),
+            self._response(429),
+            self._response(200)
+        ]
+
+        response = self.exporter._post_with_retry('https://api.notion.com/v1/pages', {})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.exporter.session.post.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+
+    @patch('adapters.notion_adapter.time.sleep')
+    def test_post_with_retry_gives_up_after_max_retries(self, mock_sleep):
+        """Testa que, esgotadas as tentativas, a última resposta é devolvida."""
+        self.exporter.session.post.return_value = self._response(503)
+
+        response = self.exporter._post_with_retry('https://api.notion.com/v1/pages', {})
+
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(self.exporter.session.post.call_count, self.exporter.MAX_RETRIES + 1)
+        self.assertEqual(mock_sleep.call_count, self.exporter.MAX_RETRIES)
+
+    @patch('adapters.notion_adapter.time.sleep')
+    def test_post_with_retry_raises_after_connection_failures(self, mock_sleep):
+        """Testa que falhas de conexão persistentes são propagadas."""
+        self.exporter.session.post.side_effect = requests.exceptions.ConnectionError('sem rede')
+
+        with self.assertRaises(requests.exceptions.ConnectionError):
+            self.exporter._post_with_retry('https://api.notion.com/v1/pages', {})
+
+        self.assertEqual(self.exporter.session.post.call_count, self.exporter.MAX_RETRIES + 1)
+
+    @patch('adapters.notion_adapter.time.sleep')
+    def test_post_with_retry_does_not_repeat_client_errors(self, mock_sleep):
+        """Testa que erros definitivos (ex.: 400) não são repetidos."""
+        self.exporter.session.post.return_value = self._response(400)
+
+        response = self.exporter._post_with_retry('https://api.notion.com/v1/pages', {})
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.exporter.session.post.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch('adapters.notion_adapter.time.sleep')
+    def test_post_with_retry_does_not_repeat_other_server_errors(self, mock_sleep):
+        """Testa que 500/502/504 não são repetidos: a página pode já ter sido criada."""
+        for status_code in (500, 502, 504):
+            self.exporter.session.post.reset_mock()
+            self.exporter.session.post.return_value = self._response(status_code)
+
+            response = self.exporter._post_with_retry('https://api.notion.com/v1/pages', {})
+
+            self.assertEqual(response.status_code, status_code)
+            self.assertEqual(self.exporter.session.post.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch('adapters.notion_adapter.time.sleep')
+    def test_post_with_retry_does_not_repeat_read_timeout(self, mock_sleep):
+        """Testa que um timeout de leitura é propagado sem novo POST."""
+        self.exporter.session.post.side_effect = requests.exceptions.ReadTimeout('sem resposta')
+
+        with self.assertRaises(requests.exceptions.ReadTimeout):
+            self.exporter._post_with_retry('https://api.notion.com/v1/pages', {})
+
+        self.assertEqual(self.exporter.session.post.call_count, 1)
+        mock_sleep.assert_not_called()
+
+    @patch('adapters.notion_adapter.time.sleep')
+    def test_post_with_retry_repeats_connect_timeout(self, mock_sleep):
+        """Testa que um timeout de conexão (requisição não enviada) é repetido."""
+        self.exporter.session.post.side_effect = [
+            requests.exceptions.ConnectTimeout('sem conexão'),
+            self._response(200)
+        ]
+
+        response = self.exporter._post_with_retry('https://api.notion.com/v1/pages', {})
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.exporter.session.post.call_count, 2)
+
+    @patch('adapters.notion_adapter.time.sleep')
+    @patch('adapters.notion_adapter.time.monotonic')
+    def test_throttle_request_spaces_requests(self, mock_monotonic, mock_sleep):
+        """Testa que requisições seguidas esperam o REQUEST_INTERVAL."""
+        self.exporter.REQUEST_INTERVAL = 0.5
+        self.exporter._last_request_time = 100.0
+        mock_monotonic.return_value = 100.2
+
+        self.exporter._throttle_request()
+
+        mock_sleep.assert_called_once()
+        self.assertAlmostEqual(mock_sleep.call_args.args[0], 0.3)
+
+    def _assert_rows_match_dictreader(self, data):
+        """Compara _iter_rows com o csv.DictReader nas colunas de CSV_COLUMNS."""
+        rows = list(self.exporter._iter_rows(io.StringIO(data, newline='')))
+        expected = list(csv.DictReader(io.StringIO(data, newline='')))
+
+        self.assertEqual(len(rows), len(expected))
+        for row, expected_row in zip(rows, expected):
+            for column in self.exporter.CSV_COLUMNS:
+                self.assertEqual(row.get(column), expected_row.get(column), column)
+        return rows
+
+    def test_iter_rows_keeps_only_used_columns(self):
+        """Testa que colunas fora de CSV_COLUMNS não são carregadas."""
+        rows = self._assert_rows_match_dictreader('Nome,Extra,Formato\nlivro.epub,x,epub\n\n')
+
+        self.assertEqual(rows, [{'Nome': 'livro.epub', 'Formato': 'epub'}])
+
+    def test_iter_rows_short_rows(self):
+        """Testa linhas com menos campos que o cabeçalho."""
+        rows = self._assert_rows_match_dictreader('Nome,Formato,Caminho\nlivro.epub\noutro.pdf,pdf\n')
+
+        self.assertEqual(rows[0], {'Nome': 'livro.epub'})
+        self.assertEqual(rows[1], {'Nome': 'outro.pdf', 'Formato': 'pdf'})
+
+    def test_iter_rows_missing_columns(self):
+        """Testa um CSV sem várias das colunas esperadas."""
+        rows = self._assert_rows_match_dictreader('Caminho\n/livros/a.epub\n')
+
+        self.assertEqual(rows, [{'Caminho': '/livros/a.epub'}])
+
+    def test_iter_rows_bom_header(self):
+        """Testa um cabeçalho com BOM, decodificado como no import (utf-8)."""
+        data = '\ufeffNome,Formato\nlivro.epub,epub\n'
+
+        rows = self._assert_rows_match_dictreader(data)
+
+        self.assertEqual(rows, [{'Formato': 'epub'}])
+
+    def test_iter_rows_empty_file(self):
+        """Testa um arquivo vazio."""
+        self.assertEqual(list(self.exporter._iter_rows(io.StringIO(''))), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+# tests/core/services/test_notion_export_service.py
+import csv
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import Mock
+from core.services.notion_export_service import NotionExportService
+from core.domain.notion_export_config import NotionExportConfig
+
+
+class TestNotionExportService(unittest.TestCase):
+    """Unit tests for NotionExportService."""
+
+    def setUp(self):
+        """Set up test fixtures with mocked dependencies."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.api_client = Mock()
+        self.db_verifier = Mock()
+        self.db_creator = Mock()
+        self.record_mapper = Mock()
+
+        self.db_verifier.verify_database.return_value = (True, [], {})
+        self.record_mapper.map_to_notion_properties_and_icon.return_value = ({}, None, None)
+        self.record_mapper.create_page_content_blocks.return_value = []
+        self.api_client.create_page.return_value = {"id": "page-id"}
+        self.api_client.get_page.return_value = {}
+
+    def tearDown(self):
+        """Clean up temporary files."""
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def create_service(self, **config):
+        """Create the service with the given configuration overrides."""
+        return NotionExportService(
+            api_client=self.api_client,
+            db_verifier=self.db_verifier,
+            db_creator=self.db_creator,
+            record_mapper=self.record_mapper,
+            config=NotionExportConfig(token="secret", database_id="db-id", **config)
+        )
+
+    def create_test_csv(self, count):
+        """Create a CSV with the given number of records."""
+        csv_path = os.path.join(self.temp_dir, "books.csv")
+        with open(csv_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(["Nome", "Formato"])
+            for i in range(count):
+                writer.writerow([f"book{i}.epub", "EPUB"])
+        return csv_path
+
+    def test_export_all_records(self):
+        """Test a successful export across several chunks."""
+        service = self.create_service(batch_size=4, concurrency=2)
+
+        success, success_count, error_count, errors = service.export_csv_to_notion(self.create_test_csv(10))
+
+        self.assertTrue(success)
+        self.assertEqual(success_count, 10)
+        self.assertEqual(error_count, 0)
+        self.assertEqual(errors, [])
+        self.assertEqual(self.api_client.create_page.call_count, 10)
+
+    def test_error_limit_checked_per_record(self):
+        """Test that the export stops at the 11th error, not at the end of the chunk."""
+        self.api_client.create_page.side_effect = Exception("API error")
+        service = self.create_service(batch_size=20, concurrency=1)
+
+        success, success_count, error_count, errors = service.export_csv_to_notion(self.create_test_csv(40))
+
+        self.assertFalse(success)
+        self.assertEqual(error_count, 11)
+        self.assertEqual(len(errors), 12)
+        self.assertEqual(errors[-1], "Additional errors omitted...")
+        self.assertEqual(self.api_client.create_page.call_count, 11)
+
+    def test_error_limit_cancels_pending_records(self):
+        """Test that records of the chunk not yet started are cancelled at the error limit."""
+        calls = []
+        lock = threading.Lock()
+
+        def failing_create_page(*args):
+            with lock:
+                calls.append(args)
+            time.sleep(0.01)
+            raise Exception("API error")
+
+        self.api_client.create_page.side_effect = failing_create_page
+        service = self.create_service(batch_size=40, concurrency=2)
+
+        success, success_count, error_count, errors = service.export_csv_to_notion(self.create_test_csv(40))
+
+        self.assertEqual(error_count, 11)
+        self.assertEqual(errors[-1], "Additional errors omitted...")
+        self.assertLess(len(calls), 40)
+
+
+if __name__ == '__main__':
+    unittest.main()
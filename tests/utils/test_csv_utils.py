@@ -0,0 +1,33 @@
+"""
+Tests for the CSV helpers.
+"""
+
+import io
+import unittest
+
+from utils.csv_utils import count_csv_rows
+
+
+class TestCountCsvRows(unittest.TestCase):
+    """Tests for count_csv_rows."""
+
+    def test_counts_data_rows(self):
+        """Header is excluded, with or without a trailing newline."""
+        self.assertEqual(count_csv_rows(io.BytesIO(b"a,b\n1,2\n3,4\n")), 2)
+        self.assertEqual(count_csv_rows(io.BytesIO(b"a,b\n1,2\n3,4")), 2)
+        self.assertEqual(count_csv_rows(io.BytesIO(b"a,b\r\n1,2\r\n")), 1)
+
+    def test_empty_and_header_only(self):
+        """Empty and header-only files have no data rows."""
+        self.assertEqual(count_csv_rows(io.BytesIO(b"")), 0)
+        self.assertEqual(count_csv_rows(io.BytesIO(b"a,b\n")), 0)
+
+    def test_read_position_restored(self):
+        """The file can be read from the start after counting."""
+        f = io.BytesIO(b"a,b\n1,2\n")
+        count_csv_rows(f)
+        self.assertEqual(f.read(), b"a,b\n1,2\n")
+
+
+if __name__ == '__main__':
+    unittest.main()